@@ -1,29 +1,109 @@
 """MQTT Media Player integration."""
 
 import logging
+from functools import partial
 
+import voluptuous as vol
+from homeassistant.components import websocket_api
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
-
-from .const import DOMAIN
+from homeassistant.core import HomeAssistant, SupportsResponse
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.discovery import async_load_platform
+
+from .const import (
+    DEFAULT_PROFILE_SECONDS,
+    DEFAULT_SILENT_DEVICE_HOURS,
+    DEFAULT_SYNC_START_DELAY,
+    DOMAIN,
+    SERVICE_PLAY_SYNCHRONIZED,
+    SERVICE_PROFILE,
+)
 from .coordinator import MQTTMediaPlayerCoordinator
+from .group_play import async_handle_play_synchronized
+from .housekeeping import async_get_housekeeping
+from .log_throttle import Truncated
+from .media_player import (
+    MQTTMediaPlayerThumbnailView,
+    websocket_get_lists,
+    websocket_watch_position,
+)
+from .profiler import async_handle_profile
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.MEDIA_PLAYER]
-
-
-async def async_setup(_hass: HomeAssistant, config: dict) -> bool:
+PLATFORMS: list[Platform] = [
+    Platform.MEDIA_PLAYER,
+    Platform.SELECT,
+    Platform.SENSOR,
+]
+
+CONFIG_SCHEMA = vol.Schema(
+    {
+        vol.Optional(DOMAIN): vol.Schema(
+            {
+                # Hours without any message before a device is reported
+                vol.Optional(
+                    "silent_device_hours", default=DEFAULT_SILENT_DEVICE_HOURS
+                ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+            }
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional("duration", default=DEFAULT_PROFILE_SECONDS): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=3600)
+        ),
+    }
+)
+
+PLAY_SYNCHRONIZED_SCHEMA = vol.Schema(
+    {
+        vol.Required("entity_id"): cv.entity_ids,
+        vol.Optional("delay", default=DEFAULT_SYNC_START_DELAY): vol.All(
+            vol.Coerce(float), vol.Range(min=0.05, max=10)
+        ),
+    }
+)
+
+
+async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the integration using YAML (if needed)."""
     _LOGGER.debug("async_setup called with config: %s", config)
+    if DOMAIN in config:
+        async_get_housekeeping(hass).silent_device_hours = config[DOMAIN][
+            "silent_device_hours"
+        ]
+    hass.http.register_view(MQTTMediaPlayerThumbnailView())
+    websocket_api.async_register_command(hass, websocket_get_lists)
+    websocket_api.async_register_command(hass, websocket_watch_position)
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        partial(async_handle_profile, hass),
+        schema=PROFILE_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PLAY_SYNCHRONIZED,
+        partial(async_handle_play_synchronized, hass),
+        schema=PLAY_SYNCHRONIZED_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    # Integration-wide sensors don't belong to any config entry
+    hass.async_create_task(
+        async_load_platform(hass, Platform.SENSOR, DOMAIN, {}, config)
+    )
     return True  # Allow UI-only configuration
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up MQTT Media Player from config entry."""
     _LOGGER.info("Setting up MQTT Media Player integration for entry: %s", entry.title)
-    _LOGGER.debug("Entry data: %s", entry.data)
+    _LOGGER.debug("Entry data: %s", Truncated(entry.data))
 
     # Initialize coordinator
     coordinator = MQTTMediaPlayerCoordinator(hass, entry)
@@ -37,6 +117,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Store coordinator
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
+    # Watch for the discovery config being cleared and for silence
+    await async_get_housekeeping(hass).async_register(coordinator)
+
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -44,6 +127,30 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate old config entries."""
+    _LOGGER.debug(
+        "Migrating entry %s from version %s.%s",
+        entry.title,
+        entry.version,
+        entry.minor_version,
+    )
+
+    if entry.version == 2 and entry.minor_version < 2:
+        # 2.1 stored the validated config including derived supports_* flags,
+        # which are recomputed on load and rejected by the schema
+        mqtt_config = {
+            key: value
+            for key, value in entry.data["mqtt_config"].items()
+            if not key.startswith("supports_")
+        }
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, "mqtt_config": mqtt_config}, minor_version=2
+        )
+
+    return entry.version == 2
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Handle removal of the integration."""
     _LOGGER.info("Unloading MQTT Media Player integration for entry: %s", entry.title)
@@ -54,6 +161,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Clean up coordinator
     if DOMAIN in hass.data and entry.entry_id in hass.data[DOMAIN]:
         coordinator = hass.data[DOMAIN][entry.entry_id]
+        async_get_housekeeping(hass).async_unregister(coordinator)
         await coordinator.async_will_remove_from_hass()
         del hass.data[DOMAIN][entry.entry_id]
 
@@ -0,0 +1,99 @@
+"""Record MQTT traffic received by a coordinator for offline replay."""
+
+import asyncio
+import base64
+import json
+import logging
+import time
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import CAPTURE_FLUSH_MESSAGES, CAPTURE_FLUSH_SECONDS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def encode_message(topic: str, payload: str | bytes, timestamp: float) -> str:
+    """Encode one received message as a compact JSONL line."""
+    record = {"t": round(timestamp, 4), "topic": topic}
+    if isinstance(payload, bytes):
+        record["b64"] = base64.b64encode(payload).decode()
+    else:
+        record["p"] = payload
+    return json.dumps(record, separators=(",", ":"))
+
+
+def decode_message(record: dict) -> tuple[float, str, str | bytes]:
+    """Decode a JSONL record back into (timestamp, topic, payload)."""
+    if "b64" in record:
+        return record["t"], record["topic"], base64.b64decode(record["b64"])
+    return record["t"], record["topic"], record["p"]
+
+
+class TrafficRecorder:
+    """Append received messages to a JSONL capture file.
+
+    The first line holds the device configuration so a capture can be replayed
+    without the original config entry. Lines are buffered on the event loop and
+    written in the executor in order.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: Path, mqtt_config: dict) -> None:
+        """Initialize the recorder."""
+        self.hass = hass
+        self.path = path
+        self._mqtt_config = mqtt_config
+        self._buffer: list[str] = []
+        self._last_flush = time.monotonic()
+        self._write_lock = asyncio.Lock()
+        self._last_write: asyncio.Task | None = None
+        self.message_count = 0
+
+    async def async_start(self) -> None:
+        """Create the capture file and write the header line."""
+        header = json.dumps({"config": self._mqtt_config}, separators=(",", ":"))
+        await self.hass.async_add_executor_job(self._write, [header], "w")
+        _LOGGER.info("Recording MQTT traffic to %s", self.path)
+
+    async def async_stop(self) -> None:
+        """Flush any buffered messages and close out the capture."""
+        self._async_flush()
+        if self._last_write is not None:
+            # Writes take the lock in flush order, so this one finishes last
+            await self._last_write
+        _LOGGER.info("Recorded %d messages to %s", self.message_count, self.path)
+
+    @callback
+    def record(self, topic: str, payload: str | bytes) -> None:
+        """Buffer one received message."""
+        self._buffer.append(encode_message(topic, payload, time.time()))
+        self.message_count += 1
+        if (
+            len(self._buffer) >= CAPTURE_FLUSH_MESSAGES
+            or time.monotonic() - self._last_flush >= CAPTURE_FLUSH_SECONDS
+        ):
+            self._async_flush()
+
+    @callback
+    def _async_flush(self) -> None:
+        """Hand the buffered lines to the executor."""
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        lines, self._buffer = self._buffer, []
+        self._last_write = self.hass.async_create_task(self._async_write(lines))
+
+    async def _async_write(self, lines: list[str]) -> None:
+        """Write lines in the order they were flushed."""
+        async with self._write_lock:
+            try:
+                await self.hass.async_add_executor_job(self._write, lines, "a")
+            except OSError:
+                _LOGGER.exception("Failed to write capture file %s", self.path)
+
+    def _write(self, lines: list[str], mode: str) -> None:
+        """Write lines to the capture file (runs in executor)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open(mode, encoding="utf-8") as capture_file:
+            capture_file.writelines(f"{line}\n" for line in lines)
@@ -21,8 +21,10 @@ from .const import (
     CONFIG_TOPIC_PATTERN,
     DISCOVERY_TOPIC,
     DOMAIN,
+    expand_configuration,
     validate_configuration,
 )
+from .log_throttle import Truncated
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,6 +35,8 @@ class MqttMediaPlayerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for MQTT Media Player v2.0."""
 
     VERSION = 2
+    # 2.2 stores the discovery payload as published (compact form)
+    MINOR_VERSION = 2
 
     def __init__(self) -> None:
         """Initialize the config flow."""
@@ -41,7 +45,11 @@ class MqttMediaPlayerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def async_step_mqtt(self, discovery_info: dict):
         """Handle MQTT discovery."""
-        _LOGGER.debug("MQTT discovery triggered: %s", discovery_info)
+        _LOGGER.debug("MQTT discovery triggered: %s", Truncated(discovery_info))
+
+        if not discovery_info["payload"]:
+            # A cleared config removes the device, handled in housekeeping.py
+            return self.async_abort(reason="device_removed")
 
         try:
             # Extract device info from discovery
@@ -49,7 +57,7 @@ class MqttMediaPlayerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             device_name = discovery_info["topic"].split("/")[-2]
 
             _LOGGER.debug("Processing discovery for device: %s", device_name)
-            _LOGGER.debug("Discovery config data: %s", config_data)
+            _LOGGER.debug("Discovery config data: %s", Truncated(config_data))
 
             # Validate configuration against v2.0 spec
             try:
@@ -62,14 +70,19 @@ class MqttMediaPlayerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             # Create unique ID from device name or unique_id in config
             unique_id = validated_config.get("unique_id", device_name)
 
-            # Set unique ID to prevent duplicates
+            # Set unique ID to prevent duplicates. Entries created before the
+            # discovery topic was stored get it from their retained config,
+            # so clearing that config removes them (see housekeeping.py)
             await self.async_set_unique_id(unique_id)
-            self._abort_if_unique_id_configured()
+            self._abort_if_unique_id_configured(
+                updates={"discovery_topic": discovery_info["topic"]},
+                reload_on_update=False,
+            )
 
-            # Store discovered device
+            # Store discovered device, keeping the compact form for the entry
             self._discovered_devices[device_name] = {
                 "name": validated_config.get("name", device_name),
-                "config": validated_config,
+                "config": config_data,
                 "unique_id": unique_id,
             }
 
@@ -92,7 +105,10 @@ class MqttMediaPlayerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
             return self.async_create_entry(
                 title=device_info["name"],
-                data={"mqtt_config": device_info["config"]},
+                data={
+                    "mqtt_config": device_info["config"],
+                    "discovery_topic": CONFIG_TOPIC_PATTERN.format(device_name),
+                },
             )
 
         device_name = list(self._discovered_devices.keys())[0]
@@ -150,7 +166,10 @@ class MqttMediaPlayerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
             return self.async_create_entry(
                 title=device_info["name"],
-                data={"mqtt_config": device_info["config"]},
+                data={
+                    "mqtt_config": device_info["config"],
+                    "discovery_topic": CONFIG_TOPIC_PATTERN.format(device_name),
+                },
             )
 
         # Discover available devices
@@ -227,14 +246,21 @@ class MqttMediaPlayerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     # Try to fetch MQTT config
                     mqtt_config = await self._fetch_mqtt_config(device_name)
                     if mqtt_config:
+                        expanded_config = expand_configuration(mqtt_config)
+
                         # Set unique ID
-                        unique_id = mqtt_config.get("unique_id", device_name)
+                        unique_id = expanded_config.get("unique_id", device_name)
                         await self.async_set_unique_id(unique_id)
                         self._abort_if_unique_id_configured()
 
                         return self.async_create_entry(
-                            title=mqtt_config.get("name", device_name),
-                            data={"mqtt_config": mqtt_config},
+                            title=expanded_config.get("name", device_name),
+                            data={
+                                "mqtt_config": mqtt_config,
+                                "discovery_topic": CONFIG_TOPIC_PATTERN.format(
+                                    device_name
+                                ),
+                            },
                         )
                     errors[CONF_NAME] = "device_not_found"
 
@@ -268,7 +294,7 @@ class MqttMediaPlayerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 device_name = message.topic.split("/")[-2]
 
                 _LOGGER.debug("Discovered device: %s", device_name)
-                _LOGGER.debug("Device config: %s", config_data)
+                _LOGGER.debug("Device config: %s", Truncated(config_data))
 
                 discovered_configs.append(
                     {
@@ -302,7 +328,9 @@ class MqttMediaPlayerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     existing_entry = None
                     for entry in self._async_current_entries():
                         if (
-                            entry.data.get("mqtt_config", {}).get("unique_id")
+                            expand_configuration(entry.data.get("mqtt_config", {})).get(
+                                "unique_id"
+                            )
                             == unique_id
                         ):
                             existing_entry = entry
@@ -311,7 +339,7 @@ class MqttMediaPlayerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     if existing_entry is None:
                         self._discovered_devices[device_name] = {
                             "name": validated_config.get("name", device_name),
-                            "config": validated_config,
+                            "config": config_data,
                             "unique_id": unique_id,
                         }
                         _LOGGER.debug("Added valid discovered device: %s", device_name)
@@ -343,7 +371,10 @@ class MqttMediaPlayerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             subscription()
 
     async def _fetch_mqtt_config(self, device_name: str) -> dict[str, Any] | None:
-        """Fetch MQTT config for a specific device."""
+        """Fetch and validate MQTT config for a specific device.
+
+        Returns the config as published, so the entry keeps its compact form.
+        """
         _LOGGER.debug("Fetching MQTT config for: %s", device_name)
 
         config_topic = CONFIG_TOPIC_PATTERN.format(device_name)
@@ -371,9 +402,9 @@ class MqttMediaPlayerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
             if received_config:
                 # Validate config against v2.0 spec
-                validated_config = validate_configuration(received_config)
+                validate_configuration(received_config)
                 _LOGGER.debug("Configuration validation successful for %s", device_name)
-                return validated_config
+                return received_config
             _LOGGER.warning("No config received for device: %s", device_name)
             return None
 
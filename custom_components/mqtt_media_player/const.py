@@ -1,5 +1,7 @@
 """Constants for MQTT Media Player integration v2.0 - ha-mqtt-discoverable spec compliant."""
 
+from functools import cache
+
 import voluptuous as vol
 
 DOMAIN = "mqtt_media_player"
@@ -54,6 +56,8 @@ COMMAND_TOPICS = {
     "next_topic": ("supports_next_track", "next"),
     "previous_topic": ("supports_previous_track", "previous"),
     "volume_set_topic": ("supports_volume_set", "volume_set"),
+    "volume_up_topic": ("supports_volume_step", "volume_up"),
+    "volume_down_topic": ("supports_volume_step", "volume_down"),
     "mute_topic": ("supports_volume_mute", "mute"),
     "shuffle_set_topic": ("supports_shuffle_set", "shuffle_set"),
     "repeat_set_topic": ("supports_repeat_set", "repeat_set"),
@@ -65,13 +69,208 @@ COMMAND_TOPICS = {
     "play_media_topic": ("supports_play_media", "play_media"),
     "clear_playlist_topic": ("supports_clear_playlist", "clear_playlist"),
     "browse_media_topic": ("supports_browse_media", "browse_media"),
+    # Payload is a Unix timestamp (seconds) at which to start playing
+    "play_at_topic": ("supports_play_at", "play_at"),
+}
+
+# Command name -> topic key, for batched commands on command_topic
+COMMAND_NAMES = {
+    command: topic_key for topic_key, (_, command) in COMMAND_TOPICS.items()
+}
+
+# Payload sent for commands that don't carry a value
+DEFAULT_COMMAND_PAYLOADS = {
+    "play": "Play",
+    "pause": "Pause",
+    "stop": "Stop",
+    "next": "Next",
+    "previous": "Previous",
+    "turn_on": "ON",
+    "turn_off": "OFF",
+    "clear_playlist": "Clear",
+    "volume_up": "Up",
+    "volume_down": "Down",
+}
+
+# Abbreviated discovery keys -> full keys, so payloads can stay compact
+ABBREVIATIONS = {
+    "uniq_id": "unique_id",
+    "dev": "device",
+    # State topics
+    "stat_t": "state_topic",
+    "title_t": "media_title_topic",
+    "artist_t": "media_artist_topic",
+    "album_t": "media_album_name_topic",
+    "alb_art_t": "media_album_artist_topic",
+    "track_t": "media_track_topic",
+    "dur_t": "media_duration_topic",
+    "pos_t": "media_position_topic",
+    "cont_type_t": "media_content_type_topic",
+    "img_url_t": "media_image_url_topic",
+    "img_t": "media_image_topic",
+    "ep_t": "media_episode_topic",
+    "season_t": "media_season_topic",
+    "series_t": "media_series_title_topic",
+    "chan_t": "media_channel_topic",
+    "plist_t": "media_playlist_topic",
+    "vol_t": "volume_level_topic",
+    "muted_t": "is_volume_muted_topic",
+    "shuf_t": "shuffle_topic",
+    "rpt_t": "repeat_topic",
+    "src_t": "source_topic",
+    "src_list_t": "source_list_topic",
+    "snd_mode_t": "sound_mode_topic",
+    "snd_mode_list_t": "sound_mode_list_topic",
+    "app_id_t": "app_id_topic",
+    "app_name_t": "app_name_topic",
+    "grp_t": "group_members_topic",
+    "avty_t": "availability_topic",
+    # Command topics
+    "play_cmd_t": "play_topic",
+    "pause_cmd_t": "pause_topic",
+    "stop_cmd_t": "stop_topic",
+    "next_cmd_t": "next_topic",
+    "prev_cmd_t": "previous_topic",
+    "vol_cmd_t": "volume_set_topic",
+    "vol_up_cmd_t": "volume_up_topic",
+    "vol_down_cmd_t": "volume_down_topic",
+    "mute_cmd_t": "mute_topic",
+    "shuf_cmd_t": "shuffle_set_topic",
+    "rpt_cmd_t": "repeat_set_topic",
+    "seek_cmd_t": "seek_topic",
+    "on_cmd_t": "turn_on_topic",
+    "off_cmd_t": "turn_off_topic",
+    "src_cmd_t": "select_source_topic",
+    "snd_mode_cmd_t": "select_sound_mode_topic",
+    "media_cmd_t": "play_media_topic",
+    "clr_cmd_t": "clear_playlist_topic",
+    "brws_cmd_t": "browse_media_topic",
+    "play_at_cmd_t": "play_at_topic",
+    "cmd_t": "command_topic",
+    "img_req_t": "image_request_topic",
+    "img_resp_t": "image_response_topic",
+    "pos_int_t": "position_interval_topic",
 }
 
+# Placeholder for the base topic in topic values
+BASE_TOPIC_KEY = "~"
+
 # Additional feature mappings that don't have direct command topics
 IMPLICIT_FEATURES = {
-    "supports_volume_step": "volume_set_topic",  # Volume step is available if volume_set is available
+    # Without volume_up/down topics, steps are accumulated into volume_set
+    "supports_volume_step": "volume_set_topic",
 }
 
+# Volume step accumulation when the device has no volume_up/down topics
+VOLUME_STEP_COOLDOWN = 0.25  # seconds between volume_set publishes
+VOLUME_TARGET_HOLD = 2.0  # seconds to step from the local target, not the state
+
+# Staleness watchdog (one timer wheel for the whole integration)
+DATA_WATCHDOG = f"{DOMAIN}_watchdog"
+WATCHDOG_TICK_SECONDS = 1
+WATCHDOG_SLOTS = 64
+
+# Logging limits
+MAX_LOGGED_PAYLOAD = 200  # characters
+LOG_THROTTLE_SECONDS = 60  # per device and topic
+
+# Traffic capture
+SERVICE_START_CAPTURE = "start_capture"
+SERVICE_STOP_CAPTURE = "stop_capture"
+CAPTURE_DIRECTORY = f"{DOMAIN}/captures"  # relative to the config directory
+CAPTURE_FLUSH_MESSAGES = 100
+CAPTURE_FLUSH_SECONDS = 5
+
+# Commands waiting for the broker to reconnect
+DEFAULT_COMMAND_EXPIRY = 30  # seconds
+OUTBOX_MAX_SIZE = 32  # pending commands per device
+# Topics whose commands set a value, so only the latest pending one matters.
+# Other commands (next, volume_up, batches on command_topic, ...) are queued
+# in full.
+COLLAPSIBLE_COMMAND_TOPICS = frozenset(
+    {
+        "volume_set_topic",
+        "mute_topic",
+        "shuffle_set_topic",
+        "repeat_set_topic",
+        "seek_topic",
+        "select_source_topic",
+        "select_sound_mode_topic",
+    }
+)
+# Topics whose payload is the Unix time the command is for; queued commands
+# for a time that has passed are dropped instead of sent late
+TIMED_COMMAND_TOPICS = frozenset({"play_at_topic"})
+
+# Batched commands
+SERVICE_SEND_COMMANDS = "send_commands"
+
+# Profiler
+SERVICE_PROFILE = "profile"
+DATA_PROFILER = f"{DOMAIN}_profiler"
+PROFILE_DIRECTORY = f"{DOMAIN}/profiles"  # relative to the config directory
+DEFAULT_PROFILE_SECONDS = 60
+
+# Large payloads (JSON lists, data URIs) are parsed in the executor
+DEFAULT_LARGE_PAYLOAD_THRESHOLD = 65536  # characters
+
+# Album art requested on demand: the request payload is an image ID and the
+# device replies with raw image bytes on <image_response_topic>/<image ID>
+IMAGE_REQUEST_TOPICS = ("image_request_topic", "image_response_topic")
+IMAGE_REQUEST_TIMEOUT = 10  # seconds
+
+# Album art thumbnails
+THUMBNAIL_SIZES = [64, 128, 256, 512]
+MAX_CACHED_IMAGES = 2  # per device, current and previous track
+MAX_CONCURRENT_THUMBNAILS = 1  # per device
+
+# Resolved media_source items, shared by all players for fan-out announcements
+DATA_MEDIA_CACHE = f"{DOMAIN}_media_cache"
+RESOLVED_MEDIA_TTL = 30  # seconds
+
+# Synchronized group playback
+SERVICE_PLAY_SYNCHRONIZED = "play_synchronized"
+DEFAULT_SYNC_START_DELAY = 0.5  # seconds from the call to the shared start time
+SYNC_SKEW_WINDOW = 3  # seconds after the start to collect reported positions
+
+# Position reporting interval hints
+SERVICE_WATCH_POSITION = "watch_position"
+DEFAULT_WATCH_POSITION_SECONDS = 60
+DEFAULT_POSITION_INTERVAL = 1  # seconds, while a frontend or automation watches
+DEFAULT_POSITION_INTERVAL_IDLE = 30  # seconds, otherwise
+
+# Track change events, fired once the metadata of a new track has settled
+EVENT_TRACK_CHANGED = f"{DOMAIN}_track_changed"
+TRACK_KEY_FIELDS = ("media_title", "media_artist", "media_album_name")
+TRACK_EVENT_FIELDS = (
+    *TRACK_KEY_FIELDS,
+    "media_album_artist",
+    "media_track",
+    "media_duration",
+    "media_content_type",
+    "media_image_url",
+)
+TRACK_SETTLE_SECONDS = 1.0
+
+# Flood protection, per device
+DEFAULT_MAX_MESSAGE_RATE = 50  # messages per second
+FLOOD_BURST_SECONDS = 2  # bucket size, in seconds of messages at the max rate
+FLOOD_SAMPLE_INTERVAL = 1  # seconds between sampled dispatches in quarantine
+FLOOD_RECOVERY_INTERVALS = 10  # calm intervals before leaving quarantine
+
+# Removal of cleared devices and reports of silent ones
+DATA_HOUSEKEEPING = f"{DOMAIN}_housekeeping"
+DEFAULT_SILENT_DEVICE_HOURS = 24  # 0 disables the report
+SILENT_SWEEP_INTERVAL = 900  # seconds
+
+# Fleet summary sensors (players by state, unavailable players, groups)
+DATA_FLEET = f"{DOMAIN}_fleet"
+
+# Ingest latency, from MQTT receipt to state write
+DATA_INGEST_LATENCY = f"{DOMAIN}_ingest_latency"
+LATENCY_WINDOW = 300  # seconds, percentiles cover the last one to two windows
+LATENCY_PERCENTILES = (50, 95, 99)
+
 # Configuration validation schemas
 DEVICE_SCHEMA = vol.Schema(
     {
@@ -92,53 +291,154 @@ AVAILABILITY_SCHEMA = vol.Schema(
 )
 
 
-def _create_mqtt_config_schema() -> vol.Schema:
-    """Create the MQTT configuration schema."""
+@cache
+def get_mqtt_config_schema() -> vol.Schema:
+    """Return the MQTT configuration schema, built on first use."""
     schema_dict = {
         # Core configuration
         vol.Optional("name"): str,
         vol.Optional("unique_id"): str,
         vol.Optional("device"): DEVICE_SCHEMA,
         vol.Optional("availability"): AVAILABILITY_SCHEMA,
+        # Size (px) of album art served through the Home Assistant image proxy
+        vol.Optional("media_image_size"): vol.In(THUMBNAIL_SIZES),
+        # Content type of media_image_topic payloads, guessed when not set
+        vol.Optional("media_image_content_type"): vol.In(
+            ["image/jpeg", "image/png", "image/gif", "image/webp"]
+        ),
+        # Let clients fetch http(s) art URLs directly instead of through the proxy
+        vol.Optional("media_image_direct", default=False): bool,
+        # QoS for commands, with optional per-command overrides by command name
+        vol.Optional("qos", default=0): vol.All(vol.Coerce(int), vol.In([0, 1, 2])),
+        vol.Optional("command_qos"): {
+            vol.In(COMMAND_NAMES): vol.All(vol.Coerce(int), vol.In([0, 1, 2]))
+        },
+        # Seconds a command may wait for the broker before it is dropped
+        vol.Optional("command_expiry", default=DEFAULT_COMMAND_EXPIRY): vol.All(
+            vol.Coerce(int), vol.Range(min=0)
+        ),
+        # Hold commands while the device is unavailable, like while the broker
+        # is disconnected, and send them once it is available again
+        vol.Optional("queue_while_unavailable", default=False): bool,
+        # Position intervals requested while the player is watched, and not
+        # (0 asks the device to stop reporting), see position_interval_topic
+        vol.Optional("position_interval"): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional("position_interval_idle"): vol.All(
+            vol.Coerce(int), vol.Range(min=0)
+        ),
+        # Payloads of this many characters or more are parsed in the executor
+        vol.Optional("large_payload_threshold"): vol.All(
+            vol.Coerce(int), vol.Range(min=1024)
+        ),
+        # Messages per second above which only the newest message per topic
+        # is processed, once per second (0 disables flood protection)
+        vol.Optional("max_message_rate", default=DEFAULT_MAX_MESSAGE_RATE): vol.All(
+            vol.Coerce(int), vol.Range(min=0)
+        ),
+        # Seconds without any message before the device is marked unavailable
+        vol.Optional("staleness_timeout"): vol.All(
+            vol.Coerce(int), vol.Range(min=WATCHDOG_TICK_SECONDS)
+        ),
+        # Whether source/sound mode lists and group members are state
+        # attributes; when off they are served by select entities and the
+        # mqtt_media_player/lists websocket command instead
+        vol.Optional("lists_in_state", default=True): bool,
         # Component identifier - must match our constant
         vol.Optional("component", default=COMPONENT): vol.In([COMPONENT]),
     }
 
     # Add all state topics as optional
-    for topic_key in STATE_TOPICS:
-        schema_dict[vol.Optional(topic_key)] = str
+    topic_schema_dict = {vol.Optional(topic_key): str for topic_key in STATE_TOPICS}
 
     # Add all command topics as optional
     for topic_key in COMMAND_TOPICS:
-        schema_dict[vol.Optional(topic_key)] = str
+        topic_schema_dict[vol.Optional(topic_key)] = str
 
-    return vol.Schema(schema_dict, extra=vol.PREVENT_EXTRA)
+    # JSON topic accepting several commands in one message
+    topic_schema_dict[vol.Optional("command_topic")] = str
+
+    # Retained position reporting interval (seconds) requested from the device
+    topic_schema_dict[vol.Optional("position_interval_topic")] = str
 
+    # Album art published as raw image bytes
+    topic_schema_dict[vol.Optional("media_image_topic")] = str
 
-MQTT_CONFIG_SCHEMA = _create_mqtt_config_schema()
+    # Album art fetched on demand
+    for topic_key in IMAGE_REQUEST_TOPICS:
+        topic_schema_dict[vol.Optional(topic_key)] = str
+
+    schema_dict.update(topic_schema_dict)
+
+    # Zones of a multi-zone device, each adding to or overriding the shared
+    # topics above
+    zone_schema = vol.Schema(
+        {
+            vol.Optional("name"): str,
+            vol.Optional("unique_id"): str,
+            **topic_schema_dict,
+        },
+        extra=vol.PREVENT_EXTRA,
+    )
+    schema_dict[vol.Optional("zones")] = vol.All({str: zone_schema}, vol.Length(min=1))
+
+    return vol.Schema(schema_dict, extra=vol.PREVENT_EXTRA)
 
 
 def get_supported_features(config: dict) -> dict:
     """Determine supported features based on present topics."""
     features = {}
 
-    # Check command topics for direct feature mapping
+    # Check command topics for direct feature mapping. Several topics may enable
+    # the same feature, so any present topic is enough.
     for topic_key, (feature_flag, _) in COMMAND_TOPICS.items():
-        features[feature_flag] = topic_key in config and config[topic_key] is not None
+        features[feature_flag] = features.get(feature_flag, False) or (
+            topic_key in config and config[topic_key] is not None
+        )
 
     # Check implicit features
     for feature_flag, required_topic in IMPLICIT_FEATURES.items():
-        features[feature_flag] = (
+        features[feature_flag] = features.get(feature_flag, False) or (
             required_topic in config and config[required_topic] is not None
         )
 
     return features
 
 
+def expand_configuration(config: dict, base_topic: str | None = None) -> dict:
+    """Expand abbreviated keys and the ~ base topic in a discovery payload.
+
+    As in Home Assistant's MQTT discovery, ~ at the start or end of a topic
+    value is replaced with the value of the ~ key. Zones inherit the device's
+    ~ unless they set their own.
+    """
+    expanded = {ABBREVIATIONS.get(key, key): value for key, value in config.items()}
+    base_topic = expanded.pop(BASE_TOPIC_KEY, base_topic)
+
+    if isinstance(expanded.get("zones"), dict):
+        expanded["zones"] = {
+            zone_id: expand_configuration(zone, base_topic)
+            if isinstance(zone, dict)
+            else zone
+            for zone_id, zone in expanded["zones"].items()
+        }
+
+    if base_topic is None:
+        return expanded
+
+    for key, value in expanded.items():
+        if not key.endswith("_topic") or not isinstance(value, str):
+            continue
+        if value.startswith(BASE_TOPIC_KEY):
+            expanded[key] = base_topic + value[len(BASE_TOPIC_KEY) :]
+        elif value.endswith(BASE_TOPIC_KEY):
+            expanded[key] = value[: -len(BASE_TOPIC_KEY)] + base_topic
+    return expanded
+
+
 def validate_configuration(config: dict) -> dict:
     """Validate and enrich configuration with feature flags."""
-    # First validate against schema
-    validated_config = MQTT_CONFIG_SCHEMA(config)
+    # First expand the compact form, then validate against schema
+    validated_config = get_mqtt_config_schema()(expand_configuration(config))
 
     # Add supported features based on present topics
     supported_features = get_supported_features(validated_config)
@@ -147,6 +447,21 @@ def validate_configuration(config: dict) -> dict:
     return validated_config
 
 
+def get_zone_configuration(config: dict, zone_id: str, device_unique_id: str) -> dict:
+    """Return the effective configuration of one zone of a multi-zone device."""
+    zone = config["zones"][zone_id]
+    zone_config = {
+        key: value
+        for key, value in config.items()
+        if key != "zones" and not key.startswith("supports_")
+    }
+    zone_config.update(zone)
+    zone_config["unique_id"] = zone.get("unique_id", f"{device_unique_id}_{zone_id}")
+    zone_config["name"] = zone.get("name", zone_id)
+    zone_config.update(get_supported_features(zone_config))
+    return zone_config
+
+
 # Valid states per spec
 VALID_STATES = ["playing", "paused", "stopped", "idle", "off"]
 
@@ -1,28 +1,121 @@
 """MQTT Media Player Data Update Coordinator v2.0 - ha-mqtt-discoverable spec compliant."""
 
+import asyncio
+import hashlib
 import json
 import logging
 import math
+import time
+from functools import partial
+from pathlib import Path
+from typing import Any
 
-from homeassistant.components.mqtt import async_subscribe
+from homeassistant.components.media_player import DOMAIN as MEDIA_PLAYER_DOMAIN
+from homeassistant.components.mqtt import async_publish, async_subscribe
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
+from .capture import TrafficRecorder
 from .const import (
+    DEFAULT_LARGE_PAYLOAD_THRESHOLD,
     DOMAIN,
+    EVENT_TRACK_CHANGED,
+    IMAGE_REQUEST_TIMEOUT,
+    TRACK_EVENT_FIELDS,
+    TRACK_KEY_FIELDS,
+    TRACK_SETTLE_SECONDS,
     VALID_REPEAT_MODES,
     VALID_STATES,
     get_supported_features,
+    get_zone_configuration,
+    validate_configuration,
 )
+from .fleet import async_get_fleet
+from .flood import FloodGuard
+from .latency import IngestLatency, async_get_ingest_latency
+from .log_throttle import Truncated, WarningThrottle
+from .position_interest import PositionInterest
+from .thumbnail import ThumbnailCache, guess_image_content_type
+from .watchdog import async_get_watchdog
 
 _LOGGER = logging.getLogger(__name__)
 
+_INVALID_JSON = object()
+
+
+def _parse_json(payload: str) -> Any:
+    """Decode a JSON payload, or return _INVALID_JSON (may run in executor)."""
+    try:
+        return json.loads(payload.strip())
+    except ValueError:
+        return _INVALID_JSON
+
+
+def _parse_image_url(payload: str) -> tuple[str | None, str | None]:
+    """Return an image URL and its hash (may run in executor)."""
+    image_url = payload.strip() or None
+    if image_url is None:
+        return None, None
+    return image_url, hashlib.md5(image_url.encode()).hexdigest()[:8]  # noqa: S324
+
+
+def _hash_image(payload: bytes) -> str | None:
+    """Return the hash of raw image bytes (may run in executor)."""
+    if not payload:
+        return None
+    return hashlib.md5(payload).hexdigest()[:8]  # noqa: S324
+
+
+# State topic -> handler method name
+TOPIC_HANDLERS = {
+    "state_topic": "_handle_state",
+    "media_title_topic": "_handle_media_title",
+    "media_artist_topic": "_handle_media_artist",
+    "media_album_name_topic": "_handle_media_album_name",
+    "media_album_artist_topic": "_handle_media_album_artist",
+    "media_track_topic": "_handle_media_track",
+    "media_duration_topic": "_handle_media_duration",
+    "media_position_topic": "_handle_media_position",
+    "media_content_type_topic": "_handle_media_content_type",
+    "media_image_url_topic": "_handle_media_image_url",
+    "media_episode_topic": "_handle_media_episode",
+    "media_season_topic": "_handle_media_season",
+    "media_series_title_topic": "_handle_media_series_title",
+    "media_channel_topic": "_handle_media_channel",
+    "media_playlist_topic": "_handle_media_playlist",
+    "volume_level_topic": "_handle_volume_level",
+    "is_volume_muted_topic": "_handle_is_volume_muted",
+    "shuffle_topic": "_handle_shuffle",
+    "repeat_topic": "_handle_repeat",
+    "source_topic": "_handle_source",
+    "source_list_topic": "_handle_source_list",
+    "sound_mode_topic": "_handle_sound_mode",
+    "sound_mode_list_topic": "_handle_sound_mode_list",
+    "app_id_topic": "_handle_app_id",
+    "app_name_topic": "_handle_app_name",
+    "group_members_topic": "_handle_group_members",
+    "availability_topic": "_handle_availability",
+}
 
-class MQTTMediaPlayerCoordinator(DataUpdateCoordinator):
-    """Coordinate MQTT data for media player entities using v2.0 spec."""
 
-    def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+class MQTTMediaPlayerCoordinator(DataUpdateCoordinator):
+    """Coordinate MQTT data for media player entities using v2.0 spec.
+
+    For a multi-zone device, the coordinator of the config entry owns one child
+    coordinator per zone and subscribes to every topic once, dispatching each
+    message to all zones that use the topic.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        zone: str | None = None,
+        parent: "MQTTMediaPlayerCoordinator | None" = None,
+    ) -> None:
         """Initialize the coordinator."""
         super().__init__(
             hass,
@@ -31,8 +124,84 @@ class MQTTMediaPlayerCoordinator(DataUpdateCoordinator):
             config_entry=config_entry,
         )
         self.config_entry = config_entry
-        self.mqtt_config = config_entry.data["mqtt_config"]
+        self.zone = zone
+        self.root = parent or self
+        if parent is None:
+            # Entries store the compact discovery payload, expand it once here
+            self.mqtt_config = validate_configuration(config_entry.data["mqtt_config"])
+        else:
+            self.mqtt_config = get_zone_configuration(
+                parent.mqtt_config,
+                zone,
+                parent.mqtt_config.get("unique_id", config_entry.title),
+            )
         self._subscriptions = []
+        self.thumbnails = ThumbnailCache(hass)
+        self._log_throttle = WarningThrottle(
+            hass, _LOGGER, self.mqtt_config.get("name", config_entry.title)
+        )
+
+        # Staleness tracking, driven by the integration-wide watchdog
+        self.staleness_timeout = self.mqtt_config.get("staleness_timeout")
+        self.last_message = time.monotonic()
+        self._stale = False
+        self._available_before_stale = None
+
+        # Payloads this size or larger are parsed in the executor
+        self._large_payload_threshold = self.mqtt_config.get(
+            "large_payload_threshold", DEFAULT_LARGE_PAYLOAD_THRESHOLD
+        )
+        self._parse_sequence: dict[str, int] = {}
+
+        # Requested position reporting interval, from frontend/automation
+        # leases. Zones inheriting the device's position_interval_topic share
+        # one tracker, so they don't publish conflicting retained values
+        if parent is None:
+            self._position_interests: dict[str, PositionInterest] = {}
+        self.position_interest = self.root._position_interest_for(  # noqa: SLF001
+            self.mqtt_config
+        )
+
+        # Latest (position, time received) from media_position_topic
+        self.last_position: tuple[float, float] | None = None
+
+        # Latest (image bytes, content type) from media_image_topic
+        self.media_image: tuple[bytes, str | None] | None = None
+
+        # On-demand album art requests waiting for a response, by image ID
+        self._image_requests: dict[str, asyncio.Future[bytes]] = {}
+
+        # Metadata fields arrive separately, so track changes are settled
+        # before a single track changed event is fired
+        self._track_key: tuple | None = None
+        self._track_retained_only = True
+        self._track_settle_unsub = None
+
+        # Integration-wide counts, updated on state/availability/group changes
+        self._fleet = async_get_fleet(hass)
+
+        # Shared by all zones of a device, see latency.py
+        self.ingest_latency = (
+            parent.ingest_latency
+            if parent is not None
+            else IngestLatency(async_get_ingest_latency(hass))
+        )
+
+        # Per-device message rate limit, applied in the dispatch path
+        self.flood_guard = (
+            FloodGuard(
+                hass,
+                self.mqtt_config.get("name", config_entry.title),
+                f"device_flooding_{config_entry.entry_id}",
+                self.mqtt_config["max_message_rate"],
+                self._async_dispatch,
+            )
+            if parent is None
+            else None
+        )
+
+        # Optional traffic capture, see capture.py
+        self.recorder: TrafficRecorder | None = None
 
         # Get supported features based on configuration
         self.supported_features = get_supported_features(self.mqtt_config)
@@ -52,6 +221,7 @@ class MQTTMediaPlayerCoordinator(DataUpdateCoordinator):
             "media_position": None,
             "media_content_type": None,
             "media_image_url": None,
+            "media_image_hash": None,
             "media_episode": None,
             "media_season": None,
             "media_series_title": None,
@@ -75,12 +245,42 @@ class MQTTMediaPlayerCoordinator(DataUpdateCoordinator):
             "group_members": None,
         }
 
+        # Child coordinators of a multi-zone device
+        self.zone_coordinators: dict[str, MQTTMediaPlayerCoordinator] = {
+            zone_id: MQTTMediaPlayerCoordinator(hass, config_entry, zone_id, self)
+            for zone_id in self.mqtt_config.get("zones", {})
+        }
+
         _LOGGER.debug(
             "Initialized coordinator for: %s with features: %s",
             self.mqtt_config.get("name"),
             self.supported_features,
         )
 
+    @property
+    def device_identifiers(self) -> set[tuple[str, str]]:
+        """Return the device registry identifiers, shared by all zones."""
+        device_config = self.mqtt_config.get("device", {})
+        if "identifiers" in device_config:
+            return {(DOMAIN, identifier) for identifier in device_config["identifiers"]}
+        return {
+            (DOMAIN, self.root.mqtt_config.get("unique_id", self.config_entry.title))
+        }
+
+    @property
+    def players(self) -> list["MQTTMediaPlayerCoordinator"]:
+        """Return the coordinators backing media player entities."""
+        return list(self.zone_coordinators.values()) or [self]
+
+    def _position_interest_for(self, mqtt_config: dict) -> PositionInterest:
+        """Return the position interest tracker for a player's topic."""
+        topic = mqtt_config.get("position_interval_topic")
+        if topic is None:
+            return PositionInterest(self.hass, mqtt_config)
+        if topic not in self._position_interests:
+            self._position_interests[topic] = PositionInterest(self.hass, mqtt_config)
+        return self._position_interests[topic]
+
     async def _async_update_data(self):
         """Fetch data from MQTT - not used since we're push-based."""
         return self.data
@@ -89,55 +289,312 @@ class MQTTMediaPlayerCoordinator(DataUpdateCoordinator):
         """Subscribe to MQTT topics when coordinator is added."""
         _LOGGER.debug("Setting up MQTT subscriptions")
 
-        # Subscribe to state topics based on configuration
-        topic_handlers = {
-            "state_topic": self._handle_state,
-            "media_title_topic": self._handle_media_title,
-            "media_artist_topic": self._handle_media_artist,
-            "media_album_name_topic": self._handle_media_album_name,
-            "media_album_artist_topic": self._handle_media_album_artist,
-            "media_track_topic": self._handle_media_track,
-            "media_duration_topic": self._handle_media_duration,
-            "media_position_topic": self._handle_media_position,
-            "media_content_type_topic": self._handle_media_content_type,
-            "media_image_url_topic": self._handle_media_image_url,
-            "media_episode_topic": self._handle_media_episode,
-            "media_season_topic": self._handle_media_season,
-            "media_series_title_topic": self._handle_media_series_title,
-            "media_channel_topic": self._handle_media_channel,
-            "media_playlist_topic": self._handle_media_playlist,
-            "volume_level_topic": self._handle_volume_level,
-            "is_volume_muted_topic": self._handle_is_volume_muted,
-            "shuffle_topic": self._handle_shuffle,
-            "repeat_topic": self._handle_repeat,
-            "source_topic": self._handle_source,
-            "source_list_topic": self._handle_source_list,
-            "sound_mode_topic": self._handle_sound_mode,
-            "sound_mode_list_topic": self._handle_sound_mode_list,
-            "app_id_topic": self._handle_app_id,
-            "app_name_topic": self._handle_app_name,
-            "group_members_topic": self._handle_group_members,
-            "availability_topic": self._handle_availability,
-        }
-
-        for topic_key, handler in topic_handlers.items():
-            topic = self.mqtt_config.get(topic_key)
+        # Group handlers by topic so topics shared between zones are
+        # subscribed once
+        routes: dict[str, list[tuple[MQTTMediaPlayerCoordinator, str, str]]] = {}
+        for coordinator in self.players:
+            for topic_key, handler_name in TOPIC_HANDLERS.items():
+                topic = coordinator.mqtt_config.get(topic_key)
+                if topic:
+                    routes.setdefault(topic, []).append(
+                        (coordinator, handler_name, topic_key)
+                    )
+
+        # Album art is raw bytes on media_image_topic, and image responses on
+        # <image_response_topic>/<image ID>
+        image_routes: dict[str, list[tuple[MQTTMediaPlayerCoordinator, str, str]]] = {}
+        for coordinator in self.players:
+            topic = coordinator.mqtt_config.get("media_image_topic")
             if topic:
-                _LOGGER.debug("Subscribing to %s: %s", topic_key, topic)
-                subscription = await async_subscribe(self.hass, topic, handler, qos=0)
+                image_routes.setdefault(topic, []).append(
+                    (coordinator, "_handle_media_image", "media_image_topic")
+                )
+            topic = coordinator.mqtt_config.get("image_response_topic")
+            if topic:
+                image_routes.setdefault(f"{topic}/+", []).append(
+                    (coordinator, "_handle_image_response", "image_response_topic")
+                )
+
+        for topic_routes, encoding in ((routes, "utf-8"), (image_routes, None)):
+            for topic, targets in topic_routes.items():
+                _LOGGER.debug("Subscribing to %s for %d player(s)", topic, len(targets))
+                subscription = await async_subscribe(
+                    self.hass,
+                    topic,
+                    self._wrap_handler(targets),
+                    qos=0,
+                    encoding=encoding,
+                )
                 self._subscriptions.append(subscription)
 
         _LOGGER.info(
             "Successfully subscribed to %d MQTT topics", len(self._subscriptions)
         )
 
+        for position_interest in {c.position_interest for c in self.players}:
+            position_interest.async_start()
+        for coordinator in self.players:
+            if coordinator.staleness_timeout:
+                coordinator.last_message = time.monotonic()
+                async_get_watchdog(self.hass).async_schedule(coordinator)
+
     async def async_will_remove_from_hass(self) -> None:
         """Clean up MQTT subscriptions."""
         _LOGGER.debug("Cleaning up MQTT subscriptions")
+        for coordinator in self.players:
+            if coordinator.staleness_timeout:
+                async_get_watchdog(self.hass).async_unschedule(coordinator)
+            coordinator.thumbnails.clear()
+            coordinator._log_throttle.async_shutdown()  # noqa: SLF001
+            coordinator._fleet.async_remove_player(coordinator)  # noqa: SLF001
+            if coordinator._track_settle_unsub is not None:  # noqa: SLF001
+                coordinator._track_settle_unsub()  # noqa: SLF001
+                coordinator._track_settle_unsub = None  # noqa: SLF001
+            for request in coordinator._image_requests.values():  # noqa: SLF001
+                request.cancel()
+            coordinator._image_requests.clear()  # noqa: SLF001
+        for position_interest in {c.position_interest for c in self.players}:
+            position_interest.async_stop()
+        self.flood_guard.async_stop()
+        await self.async_stop_capture()
         for subscription in self._subscriptions:
             subscription()
         self._subscriptions.clear()
 
+    def _wrap_handler(
+        self, targets: list[tuple["MQTTMediaPlayerCoordinator", str, str]]
+    ):
+        """Wrap the handlers for one topic with per-message bookkeeping."""
+        flood_guard = self.flood_guard
+
+        @callback
+        def _message_received(message) -> None:
+            if self.recorder is not None:
+                self.recorder.record(message.topic, message.payload)
+            if flood_guard.async_admit(targets, message):
+                self._async_dispatch(targets, message)
+
+        return _message_received
+
+    @callback
+    def _async_dispatch(
+        self, targets: list[tuple["MQTTMediaPlayerCoordinator", str, str]], message
+    ) -> None:
+        """Pass a message to the handlers of every player using its topic."""
+        ingest_latency = self.ingest_latency
+        now = time.monotonic()
+        # Consumed by the first state write, so a topic shared by several
+        # zones records one sample per message, not one per zone
+        ingest_latency.current = (targets[0][2], message.timestamp)
+        try:
+            for coordinator, handler_name, _topic_key in targets:
+                coordinator.last_message = now
+                if coordinator._stale:  # noqa: SLF001
+                    coordinator._async_clear_stale()  # noqa: SLF001
+                # Resolved per message so the profiler can instrument handlers
+                getattr(coordinator, handler_name)(message)
+        finally:
+            ingest_latency.current = None
+
+    async def async_request_image(
+        self, image_id: str
+    ) -> tuple[bytes | None, str | None]:
+        """Ask the device for album art and wait for its response."""
+        request = self._image_requests.get(image_id)
+        if request is None:
+            request = self.hass.loop.create_future()
+            self._image_requests[image_id] = request
+            _LOGGER.debug("Requesting image %s", image_id)
+            try:
+                await async_publish(
+                    self.hass,
+                    self.mqtt_config["image_request_topic"],
+                    image_id,
+                    qos=0,
+                    retain=False,
+                )
+            except Exception:
+                _LOGGER.exception("Failed to request image %s", image_id)
+                self._image_requests.pop(image_id, None)
+                return None, None
+
+        try:
+            async with asyncio.timeout(IMAGE_REQUEST_TIMEOUT):
+                data = await asyncio.shield(request)
+        except TimeoutError:
+            _LOGGER.warning("No response to image request %s", image_id)
+            self._image_requests.pop(image_id, None)
+            return None, None
+
+        return data, guess_image_content_type(data)
+
+    async def async_start_capture(self, path: Path) -> None:
+        """Start recording received messages to a capture file."""
+        await self.async_stop_capture()
+        recorder = TrafficRecorder(
+            self.hass, path, self.config_entry.data["mqtt_config"]
+        )
+        await recorder.async_start()
+        self.recorder = recorder
+
+    async def async_stop_capture(self) -> None:
+        """Stop recording received messages."""
+        if self.recorder is None:
+            return
+        recorder, self.recorder = self.recorder, None
+        await recorder.async_stop()
+
+    @callback
+    def async_set_stale(self) -> None:
+        """Mark the device unavailable after it stopped sending messages."""
+        _LOGGER.warning(
+            "No message from %s in %d seconds, marking unavailable",
+            self.mqtt_config.get("name"),
+            self.staleness_timeout,
+        )
+        self._stale = True
+        self._available_before_stale = self.data["available"]
+        self.data["available"] = False
+        self.async_set_updated_data(self.data)
+        self._async_update_fleet()
+
+    @callback
+    def _async_clear_stale(self) -> None:
+        """Restore availability once the device sends a message again."""
+        _LOGGER.info("%s is sending messages again", self.mqtt_config.get("name"))
+        self._stale = False
+        self.data["available"] = self._available_before_stale
+        async_get_watchdog(self.hass).async_schedule(self)
+        self.async_set_updated_data(self.data)
+        self._async_update_fleet()
+
+    @callback
+    def _async_update_fleet(self) -> None:
+        """Report this player's state, availability and group to the fleet."""
+        self._fleet.async_update_player(
+            self,
+            self.data["state"],
+            self.data["available"],
+            self.data["group_members"],
+        )
+
+    # Track change detection
+    @callback
+    def _async_metadata_updated(self, message) -> None:
+        """Settle a possible track change after a metadata update."""
+        if self._track_settle_unsub is not None:
+            # Already settling, the event will include this update
+            self._track_retained_only = self._track_retained_only and message.retain
+            return
+        if tuple(self.data[field] for field in TRACK_KEY_FIELDS) != self._track_key:
+            self._track_retained_only = message.retain
+            self._track_settle_unsub = async_call_later(
+                self.hass, TRACK_SETTLE_SECONDS, self._async_track_settled
+            )
+
+    @callback
+    def _async_track_settled(self, _now) -> None:
+        """Fire a track changed event if the settled metadata is a new track."""
+        self._track_settle_unsub = None
+        track_key = tuple(self.data[field] for field in TRACK_KEY_FIELDS)
+        if track_key == self._track_key:
+            return
+        self._track_key = track_key
+        if self._track_retained_only or not any(track_key):
+            # Retained metadata restored on startup is not a track change
+            return
+
+        unique_id = self.mqtt_config.get("unique_id", self.config_entry.title)
+        event_data = {
+            "entity_id": er.async_get(self.hass).async_get_entity_id(
+                MEDIA_PLAYER_DOMAIN, DOMAIN, unique_id
+            ),
+            "unique_id": unique_id,
+            **{field: self.data[field] for field in TRACK_EVENT_FIELDS},
+        }
+        image_url = event_data["media_image_url"]
+        if image_url is not None and image_url.startswith("data:"):
+            # Data URIs can be megabytes, leave them out of the event
+            event_data["media_image_url"] = None
+        _LOGGER.debug("Track changed: %s", Truncated(event_data))
+        self.hass.bus.async_fire(EVENT_TRACK_CHANGED, event_data)
+
+    # Payload parsing, offloaded to the executor for large payloads
+    @callback
+    def _async_parse(self, message, key: str, parser, apply) -> None:
+        """Parse a payload with parser and pass the result to apply.
+
+        Payloads at or above the size threshold are parsed in the executor.
+        Results are applied in arrival order: a result is dropped if a newer
+        message for the same key arrived while it was being parsed.
+        """
+        sequence = self._parse_sequence.get(key, 0) + 1
+        self._parse_sequence[key] = sequence
+
+        if len(message.payload) < self._large_payload_threshold:
+            apply(message, parser(message.payload))
+            return
+
+        _LOGGER.debug(
+            "Parsing %d byte %s payload in executor", len(message.payload), key
+        )
+        # The parse takes over the message's latency sample, if it is still
+        # pending, so other zones handling the message don't record it too
+        ingest, self.ingest_latency.current = self.ingest_latency.current, None
+        self.hass.async_create_task(
+            self._async_parse_in_executor(message, key, parser, apply, sequence, ingest)
+        )
+
+    async def _async_parse_in_executor(
+        self, message, key: str, parser, apply, sequence: int, ingest
+    ) -> None:
+        """Parse a large payload in the executor and apply it if still current."""
+        parsed = await self.hass.async_add_executor_job(parser, message.payload)
+        if self._parse_sequence.get(key) != sequence:
+            _LOGGER.debug("Discarding stale %s payload", key)
+            return
+        # Restore the receipt time so the latency includes the parse
+        self.ingest_latency.current = ingest
+        try:
+            apply(message, parsed)
+        finally:
+            self.ingest_latency.current = None
+
+    @callback
+    def _async_handle_json_list(self, message, key: str, label: str) -> None:
+        """Handle a JSON array payload for key."""
+        self._async_parse(
+            message,
+            key,
+            _parse_json,
+            partial(self._async_apply_json_list, key, label),
+        )
+
+    @callback
+    def _async_apply_json_list(self, key: str, label: str, message, value) -> None:
+        """Apply a decoded JSON array, warning if it is invalid."""
+        if value is _INVALID_JSON:
+            self._log_throttle.warning(
+                message.topic,
+                "Invalid JSON for %s: %s",
+                label.lower(),
+                Truncated(message.payload),
+            )
+            return
+        if not isinstance(value, list):
+            self._log_throttle.warning(
+                message.topic,
+                "%s must be a JSON array: %s",
+                label,
+                Truncated(message.payload),
+            )
+            return
+        _LOGGER.debug("%s update: %s", label, Truncated(value))
+        self.data[key] = value
+        self.async_set_updated_data(self.data)
+        if key == "group_members":
+            self._async_update_fleet()
+
     # State handlers
     @callback
     def _handle_state(self, message) -> None:
@@ -147,11 +604,15 @@ class MQTTMediaPlayerCoordinator(DataUpdateCoordinator):
             _LOGGER.debug("State update: %s", state)
             self.data["state"] = state
         else:
-            _LOGGER.warning(
-                "Invalid state received: %s (valid: %s)", state, VALID_STATES
+            self._log_throttle.warning(
+                message.topic,
+                "Invalid state received: %s (valid: %s)",
+                Truncated(state),
+                VALID_STATES,
             )
             return
         self.async_set_updated_data(self.data)
+        self._async_update_fleet()
 
     @callback
     def _handle_availability(self, message) -> None:
@@ -161,40 +622,44 @@ class MQTTMediaPlayerCoordinator(DataUpdateCoordinator):
         payload_available = availability_config.get("payload_available", "online")
 
         available = payload == payload_available
-        _LOGGER.debug("Availability update: %s -> %s", payload, available)
+        _LOGGER.debug("Availability update: %s -> %s", Truncated(payload), available)
         self.data["available"] = available
         self.async_set_updated_data(self.data)
+        self._async_update_fleet()
 
     # Media information handlers
     @callback
     def _handle_media_title(self, message) -> None:
         """Handle media title updates."""
         title = message.payload.strip() or None
-        _LOGGER.debug("Media title update: %s", title)
+        _LOGGER.debug("Media title update: %s", Truncated(title))
         self.data["media_title"] = title
         self.async_set_updated_data(self.data)
+        self._async_metadata_updated(message)
 
     @callback
     def _handle_media_artist(self, message):
         """Handle media artist updates."""
         artist = message.payload.strip() or None
-        _LOGGER.debug("Media artist update: %s", artist)
+        _LOGGER.debug("Media artist update: %s", Truncated(artist))
         self.data["media_artist"] = artist
         self.async_set_updated_data(self.data)
+        self._async_metadata_updated(message)
 
     @callback
     def _handle_media_album_name(self, message):
         """Handle media album name updates."""
         album = message.payload.strip() or None
-        _LOGGER.debug("Media album name update: %s", album)
+        _LOGGER.debug("Media album name update: %s", Truncated(album))
         self.data["media_album_name"] = album
         self.async_set_updated_data(self.data)
+        self._async_metadata_updated(message)
 
     @callback
     def _handle_media_album_artist(self, message):
         """Handle media album artist updates."""
         album_artist = message.payload.strip() or None
-        _LOGGER.debug("Media album artist update: %s", album_artist)
+        _LOGGER.debug("Media album artist update: %s", Truncated(album_artist))
         self.data["media_album_artist"] = album_artist
         self.async_set_updated_data(self.data)
 
@@ -206,7 +671,9 @@ class MQTTMediaPlayerCoordinator(DataUpdateCoordinator):
             _LOGGER.debug("Media track update: %s", track)
             self.data["media_track"] = track
         except (ValueError, TypeError):
-            _LOGGER.warning("Invalid track number: %s", message.payload)
+            self._log_throttle.warning(
+                message.topic, "Invalid track number: %s", Truncated(message.payload)
+            )
             self.data["media_track"] = None
         self.async_set_updated_data(self.data)
 
@@ -219,7 +686,9 @@ class MQTTMediaPlayerCoordinator(DataUpdateCoordinator):
             _LOGGER.debug("Media duration update: %s (from %s)", duration_int, duration)
             self.data["media_duration"] = duration_int
         except (ValueError, TypeError):
-            _LOGGER.warning("Invalid duration value: %s", message.payload)
+            self._log_throttle.warning(
+                message.topic, "Invalid duration value: %s", Truncated(message.payload)
+            )
             self.data["media_duration"] = None
         self.async_set_updated_data(self.data)
 
@@ -231,8 +700,13 @@ class MQTTMediaPlayerCoordinator(DataUpdateCoordinator):
             position_int = math.ceil(position) if position >= 0 else None
             _LOGGER.debug("Media position update: %s (from %s)", position_int, position)
             self.data["media_position"] = position_int
+            # Unrounded, with the wall clock time it was received, to measure
+            # synchronized start skew
+            self.last_position = (position, time.time())
         except (ValueError, TypeError):
-            _LOGGER.warning("Invalid position value: %s", message.payload)
+            self._log_throttle.warning(
+                message.topic, "Invalid position value: %s", Truncated(message.payload)
+            )
             self.data["media_position"] = None
         self.async_set_updated_data(self.data)
 
@@ -240,23 +714,26 @@ class MQTTMediaPlayerCoordinator(DataUpdateCoordinator):
     def _handle_media_content_type(self, message):
         """Handle media content type updates."""
         content_type = message.payload.strip() or "music"
-        _LOGGER.debug("Media content type update: %s", content_type)
+        _LOGGER.debug("Media content type update: %s", Truncated(content_type))
         self.data["media_content_type"] = content_type
         self.async_set_updated_data(self.data)
 
     @callback
     def _handle_media_image_url(self, message):
         """Handle media image URL updates."""
-        image_url = message.payload.strip() or None
-        _LOGGER.debug("Media image URL update: %s", image_url)
-        self.data["media_image_url"] = image_url
-        self.async_set_updated_data(self.data)
+        # Data URIs can be megabytes, so hashing may run in the executor
+        self._async_parse(
+            message,
+            "media_image_url",
+            _parse_image_url,
+            self._async_apply_media_image_url,
+        )
 
     @callback
     def _handle_media_episode(self, message):
         """Handle media episode updates."""
         episode = message.payload.strip() or None
-        _LOGGER.debug("Media episode update: %s", episode)
+        _LOGGER.debug("Media episode update: %s", Truncated(episode))
         self.data["media_episode"] = episode
         self.async_set_updated_data(self.data)
 
@@ -264,7 +741,7 @@ class MQTTMediaPlayerCoordinator(DataUpdateCoordinator):
     def _handle_media_season(self, message):
         """Handle media season updates."""
         season = message.payload.strip() or None
-        _LOGGER.debug("Media season update: %s", season)
+        _LOGGER.debug("Media season update: %s", Truncated(season))
         self.data["media_season"] = season
         self.async_set_updated_data(self.data)
 
@@ -272,7 +749,7 @@ class MQTTMediaPlayerCoordinator(DataUpdateCoordinator):
     def _handle_media_series_title(self, message):
         """Handle media series title updates."""
         series_title = message.payload.strip() or None
-        _LOGGER.debug("Media series title update: %s", series_title)
+        _LOGGER.debug("Media series title update: %s", Truncated(series_title))
         self.data["media_series_title"] = series_title
         self.async_set_updated_data(self.data)
 
@@ -280,7 +757,7 @@ class MQTTMediaPlayerCoordinator(DataUpdateCoordinator):
     def _handle_media_channel(self, message):
         """Handle media channel updates."""
         channel = message.payload.strip() or None
-        _LOGGER.debug("Media channel update: %s", channel)
+        _LOGGER.debug("Media channel update: %s", Truncated(channel))
         self.data["media_channel"] = channel
         self.async_set_updated_data(self.data)
 
@@ -288,7 +765,7 @@ class MQTTMediaPlayerCoordinator(DataUpdateCoordinator):
     def _handle_media_playlist(self, message):
         """Handle media playlist updates."""
         playlist = message.payload.strip() or None
-        _LOGGER.debug("Media playlist update: %s", playlist)
+        _LOGGER.debug("Media playlist update: %s", Truncated(playlist))
         self.data["media_playlist"] = playlist
         self.async_set_updated_data(self.data)
 
@@ -302,10 +779,14 @@ class MQTTMediaPlayerCoordinator(DataUpdateCoordinator):
                 _LOGGER.debug("Volume level update: %s", volume)
                 self.data["volume_level"] = volume
             else:
-                _LOGGER.warning("Volume level out of range (0.0-1.0): %s", volume)
+                self._log_throttle.warning(
+                    message.topic, "Volume level out of range (0.0-1.0): %s", volume
+                )
                 return
         except (ValueError, TypeError):
-            _LOGGER.warning("Invalid volume level: %s", message.payload)
+            self._log_throttle.warning(
+                message.topic, "Invalid volume level: %s", Truncated(message.payload)
+            )
             return
         self.async_set_updated_data(self.data)
 
@@ -314,7 +795,7 @@ class MQTTMediaPlayerCoordinator(DataUpdateCoordinator):
         """Handle volume mute state updates."""
         payload = message.payload.strip().lower()
         muted = payload in ("true", "1", "on", "yes")
-        _LOGGER.debug("Volume muted update: %s -> %s", payload, muted)
+        _LOGGER.debug("Volume muted update: %s -> %s", Truncated(payload), muted)
         self.data["is_volume_muted"] = muted
         self.async_set_updated_data(self.data)
 
@@ -324,7 +805,7 @@ class MQTTMediaPlayerCoordinator(DataUpdateCoordinator):
         """Handle shuffle state updates."""
         payload = message.payload.strip().lower()
         shuffle = payload in ("true", "1", "on", "yes")
-        _LOGGER.debug("Shuffle update: %s -> %s", payload, shuffle)
+        _LOGGER.debug("Shuffle update: %s -> %s", Truncated(payload), shuffle)
         self.data["shuffle"] = shuffle
         self.async_set_updated_data(self.data)
 
@@ -336,8 +817,11 @@ class MQTTMediaPlayerCoordinator(DataUpdateCoordinator):
             _LOGGER.debug("Repeat mode update: %s", repeat_mode)
             self.data["repeat"] = repeat_mode
         else:
-            _LOGGER.warning(
-                "Invalid repeat mode: %s (valid: %s)", repeat_mode, VALID_REPEAT_MODES
+            self._log_throttle.warning(
+                message.topic,
+                "Invalid repeat mode: %s (valid: %s)",
+                Truncated(repeat_mode),
+                VALID_REPEAT_MODES,
             )
             return
         self.async_set_updated_data(self.data)
@@ -347,58 +831,34 @@ class MQTTMediaPlayerCoordinator(DataUpdateCoordinator):
     def _handle_source(self, message):
         """Handle source updates."""
         source = message.payload.strip() or None
-        _LOGGER.debug("Source update: %s", source)
+        _LOGGER.debug("Source update: %s", Truncated(source))
         self.data["source"] = source
         self.async_set_updated_data(self.data)
 
     @callback
     def _handle_source_list(self, message):
         """Handle source list updates."""
-        try:
-            source_list = json.loads(message.payload.strip())
-            if isinstance(source_list, list):
-                _LOGGER.debug("Source list update: %s", source_list)
-                self.data["source_list"] = source_list
-            else:
-                _LOGGER.warning("Source list must be a JSON array: %s", message.payload)
-                return
-        except (json.JSONDecodeError, ValueError):
-            _LOGGER.warning("Invalid JSON for source list: %s", message.payload)
-            return
-        self.async_set_updated_data(self.data)
+        self._async_handle_json_list(message, "source_list", "Source list")
 
     @callback
     def _handle_sound_mode(self, message):
         """Handle sound mode updates."""
         sound_mode = message.payload.strip() or None
-        _LOGGER.debug("Sound mode update: %s", sound_mode)
+        _LOGGER.debug("Sound mode update: %s", Truncated(sound_mode))
         self.data["sound_mode"] = sound_mode
         self.async_set_updated_data(self.data)
 
     @callback
     def _handle_sound_mode_list(self, message):
         """Handle sound mode list updates."""
-        try:
-            sound_mode_list = json.loads(message.payload.strip())
-            if isinstance(sound_mode_list, list):
-                _LOGGER.debug("Sound mode list update: %s", sound_mode_list)
-                self.data["sound_mode_list"] = sound_mode_list
-            else:
-                _LOGGER.warning(
-                    "Sound mode list must be a JSON array: %s", message.payload
-                )
-                return
-        except (json.JSONDecodeError, ValueError):
-            _LOGGER.warning("Invalid JSON for sound mode list: %s", message.payload)
-            return
-        self.async_set_updated_data(self.data)
+        self._async_handle_json_list(message, "sound_mode_list", "Sound mode list")
 
     # App information handlers
     @callback
     def _handle_app_id(self, message):
         """Handle app ID updates."""
         app_id = message.payload.strip() or None
-        _LOGGER.debug("App ID update: %s", app_id)
+        _LOGGER.debug("App ID update: %s", Truncated(app_id))
         self.data["app_id"] = app_id
         self.async_set_updated_data(self.data)
 
@@ -406,25 +866,61 @@ class MQTTMediaPlayerCoordinator(DataUpdateCoordinator):
     def _handle_app_name(self, message):
         """Handle app name updates."""
         app_name = message.payload.strip() or None
-        _LOGGER.debug("App name update: %s", app_name)
+        _LOGGER.debug("App name update: %s", Truncated(app_name))
         self.data["app_name"] = app_name
         self.async_set_updated_data(self.data)
 
+    # Album art handlers
+    @callback
+    def _handle_image_response(self, message):
+        """Handle an album art response to an image request."""
+        image_id = message.topic.rsplit("/", 1)[-1]
+        request = self._image_requests.pop(image_id, None)
+        if request is None or request.done():
+            _LOGGER.debug("Ignoring unrequested image %s", image_id)
+            return
+        _LOGGER.debug("Image %s received (%d bytes)", image_id, len(message.payload))
+        request.set_result(message.payload)
+
+    @callback
+    def _handle_media_image(self, message):
+        """Handle raw album art bytes."""
+        self._async_parse(
+            message, "media_image", _hash_image, self._async_apply_media_image
+        )
+
+    @callback
+    def _async_apply_media_image(self, message, image_hash) -> None:
+        """Store album art bytes once, to be served without decoding."""
+        if image_hash is None:
+            self.media_image = None
+        else:
+            content_type = self.mqtt_config.get(
+                "media_image_content_type"
+            ) or guess_image_content_type(message.payload)
+            self.media_image = (message.payload, content_type)
+        _LOGGER.debug(
+            "Media image update: %d bytes, hash %s", len(message.payload), image_hash
+        )
+        self.data["media_image_hash"] = image_hash
+        self.async_set_updated_data(self.data)
+        self._async_metadata_updated(message)
+
+    @callback
+    def _async_apply_media_image_url(self, message, parsed) -> None:
+        """Apply a parsed media image URL and its hash."""
+        image_url, image_hash = parsed
+        _LOGGER.debug("Media image URL update: %s", Truncated(image_url))
+        if image_url:
+            # The newest art wins, bytes from media_image_topic are now stale
+            self.media_image = None
+        self.data["media_image_url"] = image_url
+        self.data["media_image_hash"] = image_hash
+        self.async_set_updated_data(self.data)
+        self._async_metadata_updated(message)
+
     # Group property handlers
     @callback
     def _handle_group_members(self, message):
         """Handle group members updates."""
-        try:
-            group_members = json.loads(message.payload.strip())
-            if isinstance(group_members, list):
-                _LOGGER.debug("Group members update: %s", group_members)
-                self.data["group_members"] = group_members
-            else:
-                _LOGGER.warning(
-                    "Group members must be a JSON array: %s", message.payload
-                )
-                return
-        except (json.JSONDecodeError, ValueError):
-            _LOGGER.warning("Invalid JSON for group members: %s", message.payload)
-            return
-        self.async_set_updated_data(self.data)
+        self._async_handle_json_list(message, "group_members", "Group members")
@@ -0,0 +1,103 @@
+"""Integration-wide summary of all players, maintained incrementally."""
+
+from collections import Counter
+from collections.abc import Callable
+
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_FLEET
+
+
+@callback
+def async_get_fleet(hass: HomeAssistant) -> "FleetSummary":
+    """Return the integration-wide fleet summary."""
+    if DATA_FLEET not in hass.data:
+        hass.data[DATA_FLEET] = FleetSummary()
+    return hass.data[DATA_FLEET]
+
+
+class FleetSummary:
+    """Counts of players by state, unavailable players and active groups.
+
+    Coordinators report each player after a state, availability or group
+    change. Only the difference from the player's previous report is applied,
+    so an update costs O(1) regardless of the number of players, and
+    listeners are only called when a count actually changed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the summary."""
+        # player -> (state, group), as last counted
+        self._players: dict[object, tuple[str | None, frozenset | None]] = {}
+        self.states: Counter[str | None] = Counter()
+        self.unavailable: set = set()
+        # Members of each group, counted once per member reporting it
+        self._groups: Counter[frozenset] = Counter()
+        self._listeners: list[Callable[[], None]] = []
+
+    @property
+    def active_groups(self) -> int:
+        """Return the number of distinct groups of two or more players."""
+        return len(self._groups)
+
+    @callback
+    def async_add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call listener when the summary changes, return a remove function."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    @callback
+    def async_update_player(
+        self,
+        player,
+        state: str | None,
+        available: bool | None,  # noqa: FBT001
+        group_members: list[str] | None,
+    ) -> None:
+        """Count a player's current state, availability and group."""
+        if available is False:
+            state = STATE_UNAVAILABLE
+        group = (
+            frozenset(group_members)
+            if group_members and len(group_members) > 1
+            else None
+        )
+        entry = (state, group)
+        previous = self._players.get(player)
+        if entry == previous:
+            return
+
+        if previous is not None:
+            self._uncount(player, *previous)
+        self._players[player] = entry
+        self.states[state] += 1
+        if state == STATE_UNAVAILABLE:
+            self.unavailable.add(player)
+        if group is not None:
+            self._groups[group] += 1
+        self._async_notify()
+
+    @callback
+    def async_remove_player(self, player) -> None:
+        """Stop counting a player."""
+        if (previous := self._players.pop(player, None)) is not None:
+            self._uncount(player, *previous)
+            self._async_notify()
+
+    def _uncount(self, player, state: str | None, group: frozenset | None) -> None:
+        """Remove a player's previous report from the counts."""
+        self.states[state] -= 1
+        if not self.states[state]:
+            del self.states[state]
+        self.unavailable.discard(player)
+        if group is not None:
+            self._groups[group] -= 1
+            if not self._groups[group]:
+                del self._groups[group]
+
+    @callback
+    def _async_notify(self) -> None:
+        """Call the listeners."""
+        for listener in list(self._listeners):
+            listener()
@@ -0,0 +1,152 @@
+"""Flood protection for devices that publish too many messages."""
+
+import logging
+import time
+from collections.abc import Callable
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import issue_registry as ir
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import (
+    DOMAIN,
+    FLOOD_BURST_SECONDS,
+    FLOOD_RECOVERY_INTERVALS,
+    FLOOD_SAMPLE_INTERVAL,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class FloodGuard:
+    """Token bucket limiting the messages one device may dispatch.
+
+    Each message takes a token; tokens refill at rate per second, up to
+    FLOOD_BURST_SECONDS worth. Retained messages are not charged: the broker
+    replays every retained topic of every zone at once on subscribe, which
+    is not the device flooding. When the bucket runs dry the device is
+    quarantined: messages are no longer dispatched as they arrive, only the
+    newest message per topic is dispatched once per FLOOD_SAMPLE_INTERVAL,
+    and a repair issue is raised. Once the device has stayed within its rate
+    for FLOOD_RECOVERY_INTERVALS intervals in a row, it is released. A rate
+    of 0 disables the guard.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        issue_id: str,
+        rate: float,
+        dispatch: Callable[[list, object], None],
+    ) -> None:
+        """Initialize the guard."""
+        self.hass = hass
+        self._name = name
+        self._issue_id = issue_id
+        self._rate = rate
+        self._burst = rate * FLOOD_BURST_SECONDS
+        self._dispatch = dispatch
+        self._tokens = self._burst
+        self._last_refill = time.monotonic()
+
+        # Quarantine state
+        self.quarantined = False
+        # topic -> (targets, newest message)
+        self._sampled: dict[str, tuple[list, object]] = {}
+        self._received = 0
+        self._calm_intervals = 0
+        self._unsub_sample = None
+
+    @callback
+    def async_admit(self, targets: list, message) -> bool:
+        """Return True if message may be dispatched now.
+
+        Otherwise the guard keeps it and dispatches it later if it is still
+        the newest message on its topic.
+        """
+        if not self._rate:
+            return True
+        if self.quarantined:
+            self._received += 1
+            self._sampled[message.topic] = (targets, message)
+            return False
+        if message.retain:
+            return True
+
+        now = time.monotonic()
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._last_refill) * self._rate
+        )
+        self._last_refill = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+
+        self._async_quarantine()
+        self._received = 1
+        self._sampled[message.topic] = (targets, message)
+        return False
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop sampling and withdraw the repair issue."""
+        if self._unsub_sample is not None:
+            self._unsub_sample()
+            self._unsub_sample = None
+        self._sampled.clear()
+        if self.quarantined:
+            self.quarantined = False
+            ir.async_delete_issue(self.hass, DOMAIN, self._issue_id)
+
+    @callback
+    def _async_quarantine(self) -> None:
+        """Switch to sampled processing and raise a repair issue."""
+        _LOGGER.warning(
+            "%s is sending more than %d messages per second, processing only "
+            "the newest message per topic every %d second(s)",
+            self._name,
+            self._rate,
+            FLOOD_SAMPLE_INTERVAL,
+        )
+        self.quarantined = True
+        self._calm_intervals = 0
+        self._unsub_sample = async_track_time_interval(
+            self.hass, self._async_sample, timedelta(seconds=FLOOD_SAMPLE_INTERVAL)
+        )
+        ir.async_create_issue(
+            self.hass,
+            DOMAIN,
+            self._issue_id,
+            is_fixable=False,
+            severity=ir.IssueSeverity.WARNING,
+            translation_key="device_flooding",
+            translation_placeholders={
+                "name": self._name,
+                "rate": str(self._rate),
+            },
+        )
+
+    @callback
+    def _async_sample(self, _now=None) -> None:
+        """Dispatch the newest message per topic and check for recovery."""
+        sampled, self._sampled = self._sampled, {}
+        received, self._received = self._received, 0
+        for targets, message in sampled.values():
+            self._dispatch(targets, message)
+
+        if received > self._rate * FLOOD_SAMPLE_INTERVAL:
+            self._calm_intervals = 0
+            return
+        self._calm_intervals += 1
+        if self._calm_intervals < FLOOD_RECOVERY_INTERVALS:
+            return
+
+        _LOGGER.info("%s message rate is back to normal", self._name)
+        self._unsub_sample()
+        self._unsub_sample = None
+        self.quarantined = False
+        self._tokens = self._burst
+        self._last_refill = time.monotonic()
+        ir.async_delete_issue(self.hass, DOMAIN, self._issue_id)
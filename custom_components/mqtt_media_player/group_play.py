@@ -0,0 +1,115 @@
+"""Synchronized playback start for groups of players."""
+
+import asyncio
+import logging
+import time
+
+from homeassistant.components.media_player import DOMAIN as MEDIA_PLAYER_DOMAIN
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
+from homeassistant.exceptions import ServiceValidationError
+
+from .const import DOMAIN, SYNC_SKEW_WINDOW
+from .media_player import MQTTMediaPlayer
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _group_players(
+    hass: HomeAssistant, entity_ids: list[str]
+) -> dict[str, MQTTMediaPlayer]:
+    """Return the targeted players and their group members, by entity ID."""
+    component = hass.data.get(MEDIA_PLAYER_DOMAIN)
+    players: dict[str, MQTTMediaPlayer] = {}
+    for entity_id in entity_ids:
+        player = component.get_entity(entity_id) if component else None
+        if not isinstance(player, MQTTMediaPlayer):
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="not_mqtt_media_player",
+                translation_placeholders={"entity_id": entity_id},
+            )
+        players[entity_id] = player
+
+        for member_id in player.coordinator.data.get("group_members") or []:
+            member = component.get_entity(member_id)
+            if isinstance(member, MQTTMediaPlayer):
+                players.setdefault(member_id, member)
+            else:
+                _LOGGER.debug("Skipping group member %s, not an MQTT player", member_id)
+    return players
+
+
+def _start_offsets(
+    players: dict[str, MQTTMediaPlayer], start_at: float
+) -> dict[str, float]:
+    """Return each player's start relative to start_at (ms), from positions.
+
+    A position received at wall clock time t means playback started at
+    t - position. Players without a position since the start are left out,
+    as are players without play_at_topic: they were started as soon as the
+    service was called, so their offset would be the delay, not drift.
+    """
+    offsets = {}
+    for entity_id, player in players.items():
+        if not player.coordinator.supported_features.get("supports_play_at"):
+            continue
+        last_position = player.coordinator.last_position
+        if last_position is None:
+            continue
+        position, received = last_position
+        if received <= start_at:
+            continue
+        offsets[entity_id] = round((received - position - start_at) * 1000, 1)
+    return offsets
+
+
+async def _async_measure_skew(
+    players: dict[str, MQTTMediaPlayer], start_at: float
+) -> dict:
+    """Wait for positions after the start and report the start skew."""
+    await asyncio.sleep(max(0.0, start_at - time.time()) + SYNC_SKEW_WINDOW)
+    offsets = _start_offsets(players, start_at)
+    skew = max(offsets.values()) - min(offsets.values()) if len(offsets) > 1 else None
+    if skew is None:
+        _LOGGER.info(
+            "Synchronized start of %d players: not enough positions reported "
+            "to measure skew",
+            len(players),
+        )
+    else:
+        _LOGGER.info(
+            "Synchronized start of %d players: %.1f ms skew (%s)",
+            len(players),
+            skew,
+            offsets,
+        )
+    return {"start_at": start_at, "skew_ms": skew, "offsets_ms": offsets}
+
+
+async def async_handle_play_synchronized(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
+    """Start players and their group members at the same moment.
+
+    Players with a play_at_topic are sent a shared start time a short delay
+    ahead; players without one are sent a plain play command in the same
+    pass. All commands are published concurrently.
+    """
+    players = _group_players(hass, call.data["entity_id"])
+    start_at = time.time() + call.data["delay"]
+
+    _LOGGER.debug("Starting %s at %.3f", list(players), start_at)
+    await asyncio.gather(
+        *(
+            player.async_play_at(start_at)
+            if player.coordinator.supported_features.get("supports_play_at")
+            else player.async_media_play()
+            for player in players.values()
+        )
+    )
+
+    measurement = _async_measure_skew(players, start_at)
+    if call.return_response:
+        return await measurement
+    hass.async_create_background_task(measurement, f"{DOMAIN} start skew")
+    return None
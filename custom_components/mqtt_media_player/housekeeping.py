@@ -0,0 +1,145 @@
+"""Removal of cleared devices and reporting of silent ones."""
+
+from __future__ import annotations
+
+import logging
+import time
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.components.mqtt import async_subscribe
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import issue_registry as ir
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import (
+    CONFIG_TOPIC_PATTERN,
+    DATA_HOUSEKEEPING,
+    DEFAULT_SILENT_DEVICE_HOURS,
+    DISCOVERY_TOPIC,
+    DOMAIN,
+    SILENT_SWEEP_INTERVAL,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import MQTTMediaPlayerCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_get_housekeeping(hass: HomeAssistant) -> DeviceHousekeeping:
+    """Return the integration-wide device housekeeping."""
+    if DATA_HOUSEKEEPING not in hass.data:
+        hass.data[DATA_HOUSEKEEPING] = DeviceHousekeeping(hass)
+    return hass.data[DATA_HOUSEKEEPING]
+
+
+class DeviceHousekeeping:
+    """Watch for cleared discovery configs and devices that went silent.
+
+    One subscription to the discovery topic serves all entries: an empty
+    payload on a device's config topic (the standard way to remove an MQTT
+    device) removes its config entry, which unloads the coordinator and
+    removes the device. A periodic sweep raises a repair issue for entries
+    that have received no message for silent_device_hours.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize housekeeping."""
+        self.hass = hass
+        self.silent_device_hours = DEFAULT_SILENT_DEVICE_HOURS
+        self._coordinators: dict[str, MQTTMediaPlayerCoordinator] = {}
+        self._silent: set[str] = set()
+        self._unsub_discovery = None
+        self._unsub_sweep = None
+
+    async def async_register(self, coordinator: MQTTMediaPlayerCoordinator) -> None:
+        """Start watching the device of a config entry."""
+        first = not self._coordinators
+        self._coordinators[coordinator.config_entry.entry_id] = coordinator
+        if not first:
+            return
+
+        if self.silent_device_hours:
+            self._unsub_sweep = async_track_time_interval(
+                self.hass, self._async_sweep, timedelta(seconds=SILENT_SWEEP_INTERVAL)
+            )
+        self._unsub_discovery = await async_subscribe(
+            self.hass, DISCOVERY_TOPIC, self._async_discovery_received, qos=0
+        )
+
+    @callback
+    def async_unregister(self, coordinator: MQTTMediaPlayerCoordinator) -> None:
+        """Stop watching the device of a config entry."""
+        entry_id = coordinator.config_entry.entry_id
+        self._coordinators.pop(entry_id, None)
+        if entry_id in self._silent:
+            self._silent.discard(entry_id)
+            ir.async_delete_issue(self.hass, DOMAIN, f"device_silent_{entry_id}")
+        if self._coordinators:
+            return
+
+        if self._unsub_sweep is not None:
+            self._unsub_sweep()
+            self._unsub_sweep = None
+        if self._unsub_discovery is not None:
+            self._unsub_discovery()
+            self._unsub_discovery = None
+
+    @callback
+    def _async_discovery_received(self, message) -> None:
+        """Remove the entry of a device whose discovery config was cleared."""
+        if message.payload:
+            return
+
+        for entry_id, coordinator in self._coordinators.items():
+            entry = coordinator.config_entry
+            # Entries created before discovery_topic was stored get it when
+            # their retained config is next discovered; until then, fall back
+            # to the topic of an object ID used as unique ID
+            topic = entry.data.get(
+                "discovery_topic", CONFIG_TOPIC_PATTERN.format(entry.unique_id)
+            )
+            if topic == message.topic:
+                _LOGGER.info(
+                    "Discovery config of %s was cleared, removing it", entry.title
+                )
+                self.hass.async_create_task(
+                    self.hass.config_entries.async_remove(entry_id)
+                )
+                return
+
+    @callback
+    def _async_sweep(self, _now=None) -> None:
+        """Report entries whose devices have been silent for too long."""
+        cutoff = time.monotonic() - self.silent_device_hours * 3600
+        for entry_id, coordinator in self._coordinators.items():
+            last_message = max(player.last_message for player in coordinator.players)
+            issue_id = f"device_silent_{entry_id}"
+            if last_message > cutoff:
+                if entry_id in self._silent:
+                    self._silent.discard(entry_id)
+                    ir.async_delete_issue(self.hass, DOMAIN, issue_id)
+                continue
+            if entry_id in self._silent:
+                continue
+
+            self._silent.add(entry_id)
+            _LOGGER.warning(
+                "No message from %s in %d hours",
+                coordinator.config_entry.title,
+                self.silent_device_hours,
+            )
+            ir.async_create_issue(
+                self.hass,
+                DOMAIN,
+                issue_id,
+                is_fixable=False,
+                severity=ir.IssueSeverity.WARNING,
+                translation_key="device_silent",
+                translation_placeholders={
+                    "name": coordinator.config_entry.title,
+                    "hours": str(self.silent_device_hours),
+                },
+            )
@@ -0,0 +1,111 @@
+"""Ingest latency from MQTT receipt to state write."""
+
+import time
+from bisect import bisect_left
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_INGEST_LATENCY, LATENCY_WINDOW
+
+# Bucket upper bounds in seconds: 0.1 ms to ~9 s, 25% apart. Percentiles are
+# reported as the upper bound of their bucket, so they are at most 25% high.
+BUCKET_BOUNDS = [0.0001 * 1.25**index for index in range(52)]
+
+
+@callback
+def async_get_ingest_latency(hass: HomeAssistant) -> "IngestLatency":
+    """Return the integration-wide ingest latency tracker."""
+    if DATA_INGEST_LATENCY not in hass.data:
+        hass.data[DATA_INGEST_LATENCY] = IngestLatency()
+    return hass.data[DATA_INGEST_LATENCY]
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram covering the last one to two windows.
+
+    Counts are kept for the current and the previous window, so recording is
+    a bisect and an increment, and old samples age out without a timer.
+    """
+
+    __slots__ = ("_current", "_previous", "_rotate_at")
+
+    def __init__(self) -> None:
+        """Initialize the histogram."""
+        self._current = [0] * (len(BUCKET_BOUNDS) + 1)
+        self._previous = [0] * (len(BUCKET_BOUNDS) + 1)
+        self._rotate_at = time.monotonic() + LATENCY_WINDOW
+
+    def _rotate(self, now: float) -> None:
+        """Start a new window if the current one has ended."""
+        if now < self._rotate_at:
+            return
+        if now < self._rotate_at + LATENCY_WINDOW:
+            self._previous = self._current
+        else:
+            # Nothing recorded for over a window, both are out of date
+            self._previous = [0] * len(self._current)
+        self._current = [0] * len(self._current)
+        self._rotate_at = now + LATENCY_WINDOW
+
+    def record(self, seconds: float, now: float) -> None:
+        """Add one sample."""
+        if now >= self._rotate_at:
+            self._rotate(now)
+        self._current[bisect_left(BUCKET_BOUNDS, seconds)] += 1
+
+    def percentile(self, percent: float) -> float | None:
+        """Return the given percentile in milliseconds, None without samples."""
+        self._rotate(time.monotonic())
+        counts = [
+            current + previous
+            for current, previous in zip(self._current, self._previous, strict=True)
+        ]
+        total = sum(counts)
+        if not total:
+            return None
+
+        rank = total * percent / 100
+        seen = 0
+        for index, count in enumerate(counts):
+            seen += count
+            if seen >= rank:
+                break
+        # Samples past the last bound are reported as the last bound
+        return BUCKET_BOUNDS[min(index, len(BUCKET_BOUNDS) - 1)] * 1000
+
+
+class IngestLatency:
+    """Latency histograms for one device, or for the whole integration.
+
+    The coordinator sets ``current`` to the receiving topic and MQTT receipt
+    time while a message is handled, and the entity calls
+    async_state_written() once the resulting state is written. Samples are
+    also recorded in the parent tracker, if any.
+    """
+
+    def __init__(self, parent: "IngestLatency | None" = None) -> None:
+        """Initialize the tracker."""
+        self.current: tuple[str, float] | None = None
+        self.total = LatencyHistogram()
+        self.topics: dict[str, LatencyHistogram] = {}
+        self._parent = parent
+
+    @callback
+    def async_state_written(self) -> None:
+        """Record the latency of the message being handled, if any."""
+        if self.current is None:
+            return
+        topic_key, received = self.current
+        # One sample per message, even if handling it writes state twice
+        self.current = None
+        now = time.monotonic()
+        self._record(topic_key, now - received, now)
+
+    def _record(self, topic_key: str, seconds: float, now: float) -> None:
+        """Add a sample to the total and per-topic histograms."""
+        self.total.record(seconds, now)
+        if (histogram := self.topics.get(topic_key)) is None:
+            histogram = self.topics[topic_key] = LatencyHistogram()
+        histogram.record(seconds, now)
+        if self._parent is not None:
+            self._parent._record(topic_key, seconds, now)  # noqa: SLF001
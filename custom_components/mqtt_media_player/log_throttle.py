@@ -0,0 +1,100 @@
+"""Log throttling and payload truncation for MQTT Media Player."""
+
+import logging
+import time
+from functools import partial
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import LOG_THROTTLE_SECONDS, MAX_LOGGED_PAYLOAD
+
+
+class Truncated:
+    """Lazily truncated representation of a value for log arguments.
+
+    Formatting only happens if the record is actually emitted, so passing large
+    payloads or lists to a disabled debug call costs nothing beyond this wrapper.
+    """
+
+    __slots__ = ("_value",)
+
+    def __init__(self, value: Any) -> None:
+        """Wrap a value for logging."""
+        self._value = value
+
+    def __str__(self) -> str:
+        """Return the value, cut to MAX_LOGGED_PAYLOAD characters."""
+        text = self._value if isinstance(self._value, str) else repr(self._value)
+        if len(text) <= MAX_LOGGED_PAYLOAD:
+            return text
+        return f"{text[:MAX_LOGGED_PAYLOAD]}... ({len(text)} chars)"
+
+    __repr__ = __str__
+
+
+class WarningThrottle:
+    """Emit at most one warning per key per interval, counting the rest.
+
+    When warnings were suppressed, a summary with their count is logged at
+    the end of the interval, so the count is reported even if the burst of
+    bad payloads stops.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        logger: logging.Logger,
+        name: str,
+        interval: float = LOG_THROTTLE_SECONDS,
+    ) -> None:
+        """Initialize the throttle for one device."""
+        self._hass = hass
+        self._logger = logger
+        self._name = name
+        self._interval = interval
+        # key -> (time of last emitted warning, suppressed count)
+        self._state: dict[str, tuple[float, int]] = {}
+        # key -> cancels the pending summary
+        self._summaries: dict[str, CALLBACK_TYPE] = {}
+
+    @callback
+    def warning(self, key: str, msg: str, *args: Any) -> None:
+        """Log a warning for key unless one was logged recently."""
+        now = time.monotonic()
+        last, suppressed = self._state.get(key, (None, 0))
+
+        if last is not None and now - last < self._interval:
+            self._state[key] = (last, suppressed + 1)
+            if key not in self._summaries:
+                self._summaries[key] = async_call_later(
+                    self._hass,
+                    last + self._interval - now,
+                    partial(self._async_summarize, key),
+                )
+            return
+
+        self._state[key] = (now, 0)
+        self._logger.warning("%s: %s", self._name, msg % args)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Log pending summaries now and cancel their timers."""
+        for key, cancel in list(self._summaries.items()):
+            cancel()
+            self._async_summarize(key)
+
+    @callback
+    def _async_summarize(self, key: str, _now=None) -> None:
+        """Log the number of warnings suppressed for key in its interval."""
+        del self._summaries[key]
+        # The next warning for key starts a new interval
+        last, suppressed = self._state.pop(key)
+        self._logger.warning(
+            "%s: suppressed %d similar warnings for %s in the last %d seconds",
+            self._name,
+            suppressed,
+            key,
+            time.monotonic() - last,
+        )
@@ -0,0 +1,86 @@
+"""Short-lived cache of resolved media_source items for play_media."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_MEDIA_CACHE, RESOLVED_MEDIA_TTL
+
+if TYPE_CHECKING:
+    from homeassistant.components.media_source import PlayMedia
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_get_media_cache(hass: HomeAssistant) -> ResolvedMediaCache:
+    """Return the integration-wide resolved media cache."""
+    if DATA_MEDIA_CACHE not in hass.data:
+        hass.data[DATA_MEDIA_CACHE] = ResolvedMediaCache(hass)
+    return hass.data[DATA_MEDIA_CACHE]
+
+
+class ResolvedMediaCache:
+    """Resolve media_source IDs once per player for repeated plays.
+
+    Resolution is passed the target player and media sources may use it, so
+    items are cached per (entity ID, media ID). Resolved items are kept for
+    RESOLVED_MEDIA_TTL seconds, and calls for an item that is already being
+    resolved wait for that resolution instead of starting their own.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        # (entity ID, media ID) -> (time resolved, play item)
+        self._items: dict[tuple[str | None, str], tuple[float, PlayMedia]] = {}
+        self._pending: dict[tuple[str | None, str], asyncio.Task[PlayMedia]] = {}
+
+    async def async_resolve(self, media_id: str, entity_id: str | None) -> PlayMedia:
+        """Return the resolved play item for a media_source ID."""
+        key = (entity_id, media_id)
+        cached = self._items.get(key)
+        if cached is not None and time.monotonic() - cached[0] < RESOLVED_MEDIA_TTL:
+            _LOGGER.debug("Using cached resolution for %s", media_id)
+            return cached[1]
+
+        # Resolution runs as its own task, so a caller that is cancelled
+        # doesn't cancel it for the others waiting on it
+        if (task := self._pending.get(key)) is None:
+            task = self.hass.async_create_task(self._async_resolve(key))
+            self._pending[key] = task
+        else:
+            _LOGGER.debug("Waiting for in-flight resolution of %s", media_id)
+        return await asyncio.shield(task)
+
+    async def _async_resolve(self, key: tuple[str | None, str]) -> PlayMedia:
+        """Resolve a media_source ID and cache the play item."""
+        # Deferred so installs that never call play_media don't load it
+        from homeassistant.components import media_source  # noqa: PLC0415
+
+        entity_id, media_id = key
+        try:
+            play_item = await media_source.async_resolve_media(
+                self.hass, media_id, entity_id
+            )
+        finally:
+            del self._pending[key]
+
+        now = time.monotonic()
+        self._prune(now)
+        self._items[key] = (now, play_item)
+        return play_item
+
+    def _prune(self, now: float) -> None:
+        """Drop expired items."""
+        for key in [
+            key
+            for key, (resolved, _) in self._items.items()
+            if now - resolved >= RESOLVED_MEDIA_TTL
+        ]:
+            del self._items[key]
@@ -1,32 +1,96 @@
 """MQTT Media Player entity implementation v2.0 - ha-mqtt-discoverable spec compliant."""
 
 import hashlib
+import json
 import logging
+import time
+from http import HTTPStatus
+from pathlib import Path
 from typing import Any
 
-from homeassistant.components import media_source
+import voluptuous as vol
+from aiohttp import web
+from homeassistant.components import websocket_api
+from homeassistant.components.http import (
+    KEY_AUTHENTICATED,
+    KEY_HASS,
+    HomeAssistantView,
+)
 from homeassistant.components.media_player import (
+    ATTR_GROUP_MEMBERS,
+    DOMAIN as MEDIA_PLAYER_DOMAIN,
     MediaPlayerEntity,
     MediaPlayerEntityFeature,
     MediaPlayerState,
     RepeatMode,
     async_fetch_image,
 )
-from homeassistant.components.mqtt import async_publish
+from homeassistant.components.mqtt import (
+    async_publish,
+    async_subscribe_connection_status,
+    is_connected,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_platform
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
 from .const import (
+    CAPTURE_DIRECTORY,
+    COMMAND_NAMES,
+    COMMAND_TOPICS,
+    DEFAULT_COMMAND_EXPIRY,
+    DEFAULT_COMMAND_PAYLOADS,
+    DEFAULT_WATCH_POSITION_SECONDS,
     DOMAIN,
+    OUTBOX_MAX_SIZE,
+    SERVICE_SEND_COMMANDS,
+    SERVICE_START_CAPTURE,
+    SERVICE_STOP_CAPTURE,
+    SERVICE_WATCH_POSITION,
+    THUMBNAIL_SIZES,
+    VOLUME_STEP_COOLDOWN,
+    VOLUME_TARGET_HOLD,
 )
 from .coordinator import MQTTMediaPlayerCoordinator
+from .log_throttle import Truncated
+from .media_cache import async_get_media_cache
+from .outbox import CommandOutbox
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _require_value_payload(item: dict[str, Any]) -> dict[str, Any]:
+    """Require a payload for commands that carry a value, like volume_set."""
+    if item["command"] not in DEFAULT_COMMAND_PAYLOADS and "payload" not in item:
+        raise vol.Invalid(f"{item['command']} requires a payload", path=["payload"])
+    return item
+
+
+SEND_COMMANDS_SCHEMA = {
+    vol.Required("commands"): vol.All(
+        cv.ensure_list,
+        [
+            vol.All(
+                vol.Schema(
+                    {
+                        vol.Required("command"): vol.In(COMMAND_NAMES),
+                        vol.Optional("payload"): vol.Any(bool, vol.Coerce(str)),
+                    }
+                ),
+                _require_value_payload,
+            )
+        ],
+    ),
+}
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -37,9 +101,33 @@ async def async_setup_entry(
 
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
 
-    # Create media player entity
-    entity = MQTTMediaPlayer(coordinator, config_entry)
-    async_add_entities([entity])
+    # Create one media player entity per zone (or one for single-zone devices)
+    async_add_entities(
+        MQTTMediaPlayer(player_coordinator, config_entry)
+        for player_coordinator in coordinator.players
+    )
+
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_entity_service(
+        SERVICE_START_CAPTURE,
+        {vol.Optional("filename"): cv.string},
+        "async_start_capture",
+    )
+    platform.async_register_entity_service(
+        SERVICE_STOP_CAPTURE, None, "async_stop_capture"
+    )
+    platform.async_register_entity_service(
+        SERVICE_SEND_COMMANDS, SEND_COMMANDS_SCHEMA, "async_send_commands"
+    )
+    platform.async_register_entity_service(
+        SERVICE_WATCH_POSITION,
+        {
+            vol.Optional("duration", default=DEFAULT_WATCH_POSITION_SECONDS): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=86400)
+            )
+        },
+        "async_watch_position",
+    )
 
     _LOGGER.debug("Media player entity created for: %s", config_entry.title)
 
@@ -49,6 +137,8 @@ class MQTTMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
 
     _attr_has_entity_name = True
     _attr_should_poll = False
+    # Source and sound mode lists are already unrecorded by media_player
+    _unrecorded_attributes = frozenset({ATTR_GROUP_MEMBERS})
 
     def __init__(
         self, coordinator: MQTTMediaPlayerCoordinator, config_entry: ConfigEntry
@@ -57,7 +147,7 @@ class MQTTMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         super().__init__(coordinator)
 
         self._config_entry = config_entry
-        self._mqtt_config = config_entry.data["mqtt_config"]
+        self._mqtt_config = coordinator.mqtt_config
 
         # Set up entity attributes from config
         self._attr_unique_id = self._mqtt_config.get("unique_id", config_entry.title)
@@ -67,18 +157,10 @@ class MQTTMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
             else None
         )
 
-        # Set up device info
+        # Set up device info, shared by all zones of a multi-zone device
         device_config = self._mqtt_config.get("device", {})
-        device_identifiers = {(DOMAIN, self._attr_unique_id)}
-
-        # If device has custom identifiers, use them
-        if "identifiers" in device_config:
-            device_identifiers = {
-                (DOMAIN, identifier) for identifier in device_config["identifiers"]
-            }
-
         self._attr_device_info = DeviceInfo(
-            identifiers=device_identifiers,
+            identifiers=coordinator.device_identifiers,
             name=config_entry.title,
             manufacturer=device_config.get("manufacturer", "MQTT Media Player"),
             model=device_config.get("model", "MQTT Media Player"),
@@ -86,8 +168,71 @@ class MQTTMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
             configuration_url=device_config.get("configuration_url"),
         )
 
+        # Locally tracked volume for accumulating rapid volume steps
+        self._volume_target: float | None = None
+        self._volume_target_time = 0.0
+        self._volume_debouncer = Debouncer(
+            coordinator.hass,
+            _LOGGER,
+            cooldown=VOLUME_STEP_COOLDOWN,
+            immediate=True,
+            function=self._async_publish_volume_target,
+        )
+
+        # Commands issued while the broker is disconnected, or optionally while
+        # the device is unavailable
+        self._queue_while_unavailable = self._mqtt_config["queue_while_unavailable"]
+        self._available = coordinator.data.get("available")
+        self._outbox = CommandOutbox(
+            config_entry.title,
+            self._mqtt_config.get("command_expiry", DEFAULT_COMMAND_EXPIRY),
+            OUTBOX_MAX_SIZE,
+        )
+
         _LOGGER.debug("Initialized MQTT Media Player: %s", self._attr_unique_id)
 
+    async def async_added_to_hass(self) -> None:
+        """Track broker connection state to flush queued commands."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_subscribe_connection_status(
+                self.hass, self._async_mqtt_connection_changed
+            )
+        )
+
+    @callback
+    def _async_mqtt_connection_changed(self, connected: bool) -> None:  # noqa: FBT001
+        """Flush commands queued while the broker was disconnected."""
+        if self._queue_while_unavailable and self._available is False:
+            # Still held until the device is available
+            return
+        if connected and self._outbox:
+            self.hass.async_create_task(self._async_flush_outbox())
+
+    async def _async_flush_outbox(self) -> None:
+        """Publish unexpired queued commands in the order they were queued."""
+        commands = self._outbox.drain()
+        _LOGGER.debug("Flushing %d queued commands", len(commands))
+        for topic_key, payload in commands:
+            await self._publish_command(topic_key, payload)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state and record the latency of the message behind it."""
+        super()._handle_coordinator_update()
+        self.coordinator.ingest_latency.async_state_written()
+
+        available = self.coordinator.data.get("available")
+        if available and self._available is False and self._outbox:
+            _LOGGER.debug("%s is available again", self.entity_id)
+            self.hass.async_create_task(self._async_flush_outbox())
+        self._available = available
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel pending volume publishes."""
+        self._volume_debouncer.async_shutdown()
+        await super().async_will_remove_from_hass()
+
     @property
     def supported_features(self) -> MediaPlayerEntityFeature:
         """Return supported features based on available command topics."""
@@ -203,18 +348,44 @@ class MQTTMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
     @property
     def media_image_remotely_accessible(self) -> bool:
         """Return True if media image is accessible from outside the local network."""
-        # For URLs, let Home Assistant handle proxying
         image_url = self.coordinator.data.get("media_image_url")
-        return not (image_url and image_url.startswith(("http://", "https://")))
+        if not image_url and (
+            self._mqtt_config.get("image_request_topic")
+            or self._mqtt_config.get("media_image_topic")
+        ):
+            # Art is published as bytes or requested, and served by the proxy
+            return False
+        if not (image_url and image_url.startswith(("http://", "https://"))):
+            return True
+        # For URLs, let Home Assistant handle proxying unless clients can reach
+        # the device themselves
+        return self._mqtt_config["media_image_direct"]
 
     @property
     def media_image_hash(self) -> str | None:
         """Return a hash of the media image."""
-        image_url = self.coordinator.data.get("media_image_url")
-        if image_url:
-            return hashlib.md5(image_url.encode()).hexdigest()[:8]  # noqa: S324
+        # Computed once per URL by the coordinator, data URIs can be large
+        image_hash = self.coordinator.data.get("media_image_hash")
+        if image_hash:
+            return image_hash
+        if self._mqtt_config.get("image_request_topic"):
+            return self._track_image_id
         return None
 
+    @property
+    def _track_image_id(self) -> str | None:
+        """Return an ID for on-demand album art of the current track."""
+        data = self.coordinator.data
+        track = (
+            data.get("media_title"),
+            data.get("media_artist"),
+            data.get("media_album_name"),
+        )
+        if not any(track):
+            return None
+        key = "\x1f".join(value or "" for value in track)
+        return hashlib.md5(key.encode()).hexdigest()[:8]  # noqa: S324
+
     @property
     def media_episode(self) -> str | None:
         """Return the episode of current playing media."""
@@ -275,6 +446,8 @@ class MQTTMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
     @property
     def source_list(self) -> list[str] | None:
         """Return list of available input sources."""
+        if not self._mqtt_config["lists_in_state"]:
+            return None
         return self.coordinator.data.get("source_list")
 
     @property
@@ -285,17 +458,46 @@ class MQTTMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
     @property
     def sound_mode_list(self) -> list[str] | None:
         """Return list of available sound modes."""
+        if not self._mqtt_config["lists_in_state"]:
+            return None
         return self.coordinator.data.get("sound_mode_list")
 
     @property
     def group_members(self) -> list[str] | None:
         """Return list of group member entity IDs."""
+        if not self._mqtt_config["lists_in_state"]:
+            return None
         return self.coordinator.data.get("group_members")
 
     async def async_get_media_image(self) -> tuple[bytes | None, str | None]:
         """Fetch media image of current playing media."""
+        return await self.async_get_media_thumbnail(
+            self._mqtt_config.get("media_image_size")
+        )
+
+    async def async_get_media_thumbnail(
+        self, size: int | None
+    ) -> tuple[bytes | None, str | None]:
+        """Fetch media image resized to fit size px, or the original if None."""
+        image_hash = self.media_image_hash
+        if image_hash is None:
+            return None, None
+
+        return await self.coordinator.thumbnails.async_get(
+            image_hash, self._async_fetch_media_image, size
+        )
+
+    async def _async_fetch_media_image(self) -> tuple[bytes | None, str | None]:
+        """Fetch the original media image from the device."""
+        if self.coordinator.media_image is not None:
+            # Published as raw bytes, served as stored
+            return self.coordinator.media_image
+
         image_url = self.coordinator.data.get("media_image_url")
         if not image_url:
+            image_id = self._track_image_id
+            if image_id and self._mqtt_config.get("image_request_topic"):
+                return await self.coordinator.async_request_image(image_id)
             return None, None
 
         # Handle base64 encoded images
@@ -321,7 +523,9 @@ class MQTTMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
             try:
                 return await async_fetch_image(self.hass, image_url)
             except Exception:
-                _LOGGER.exception("Failed to fetch image from URL %s", image_url)
+                _LOGGER.exception(
+                    "Failed to fetch image from URL %s", Truncated(image_url)
+                )
                 return None, None
 
         return None, None
@@ -339,10 +543,13 @@ class MQTTMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         self, media_type: str, media_id: str, **_kwargs: Any
     ) -> None:
         """Play a piece of media."""
+        # Deferred so installs that never call play_media don't load it
+        from homeassistant.components import media_source  # noqa: PLC0415
+
         if media_source.is_media_source_id(media_id):
             media_type = "url"
-            play_item = await media_source.async_resolve_media(
-                self.hass, media_id, self.entity_id
+            play_item = await async_get_media_cache(self.hass).async_resolve(
+                media_id, self.entity_id
             )
             media_id = play_item.url
 
@@ -355,6 +562,10 @@ class MQTTMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         """Send play command."""
         await self._publish_command("play_topic", "Play")
 
+    async def async_play_at(self, start_at: float) -> None:
+        """Start playing at a Unix timestamp, for synchronized group starts."""
+        await self._publish_command("play_at_topic", f"{start_at:.3f}")
+
     async def async_media_pause(self) -> None:
         """Send pause command."""
         await self._publish_command("pause_topic", "Pause")
@@ -377,8 +588,57 @@ class MQTTMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
 
     async def async_set_volume_level(self, volume: float) -> None:
         """Set volume level, range 0..1."""
+        self._set_volume_target(volume)
         await self._publish_command("volume_set_topic", str(volume))
 
+    async def async_volume_up(self) -> None:
+        """Turn volume up, natively or by accumulating into volume_set."""
+        if self._mqtt_config.get("volume_up_topic"):
+            await self._publish_command("volume_up_topic", "Up")
+            return
+        await self._async_step_volume(self.volume_step)
+
+    async def async_volume_down(self) -> None:
+        """Turn volume down, natively or by accumulating into volume_set."""
+        if self._mqtt_config.get("volume_down_topic"):
+            await self._publish_command("volume_down_topic", "Down")
+            return
+        await self._async_step_volume(-self.volume_step)
+
+    def _set_volume_target(self, volume: float) -> None:
+        """Record the volume we last asked the device for."""
+        self._volume_target = volume
+        self._volume_target_time = time.monotonic()
+
+    async def _async_step_volume(self, step: float) -> None:
+        """Add a step to the local volume target and publish it debounced.
+
+        Rapid presses build on the target rather than the reported volume_level,
+        which lags behind, so no steps are lost. The first press publishes
+        immediately and further presses within the cooldown are sent as one
+        volume_set.
+        """
+        if (
+            self._volume_target is None
+            or time.monotonic() - self._volume_target_time > VOLUME_TARGET_HOLD
+        ):
+            if self.volume_level is None:
+                # Stepping from an assumed 0 could blast or mute the device
+                _LOGGER.warning(
+                    "%s: volume level unknown, ignoring volume step", self.entity_id
+                )
+                return
+            self._volume_target = self.volume_level
+        self._set_volume_target(min(1.0, max(0.0, self._volume_target + step)))
+        await self._volume_debouncer.async_call()
+
+    async def _async_publish_volume_target(self) -> None:
+        """Publish the accumulated volume target."""
+        if self._volume_target is not None:
+            await self._publish_command(
+                "volume_set_topic", str(round(self._volume_target, 4))
+            )
+
     async def async_mute_volume(self, mute: bool) -> None:  # noqa: FBT001
         """Mute/unmute volume."""
         payload = "ON" if mute else "OFF"
@@ -421,6 +681,61 @@ class MQTTMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         # For now, return None to indicate browsing is not supported
         return
 
+    async def async_send_commands(self, commands: list[dict[str, Any]]) -> None:
+        """Send several commands, in one message if the device has command_topic."""
+        batch = []
+        for item in commands:
+            command = item["command"]
+            topic_key = COMMAND_NAMES[command]
+            if not self._mqtt_config.get(topic_key):
+                raise ServiceValidationError(
+                    translation_domain=DOMAIN,
+                    translation_key="command_not_supported",
+                    translation_placeholders={
+                        "command": command,
+                        "entity_id": self.entity_id,
+                    },
+                )
+
+            payload = item.get("payload", DEFAULT_COMMAND_PAYLOADS.get(command))
+            if isinstance(payload, bool):
+                payload = "ON" if payload else "OFF"
+            batch.append((topic_key, command, payload))
+
+        if self._mqtt_config.get("command_topic"):
+            await self._publish_command(
+                "command_topic",
+                json.dumps(
+                    {
+                        "commands": [
+                            {"command": command, "payload": payload}
+                            for _, command, payload in batch
+                        ]
+                    }
+                ),
+            )
+            return
+
+        # No batch support, fall back to one publish per command in order
+        for topic_key, _, payload in batch:
+            await self._publish_command(topic_key, payload)
+
+    async def async_watch_position(self, duration: int) -> None:
+        """Ask the device for frequent position updates for duration seconds."""
+        self.coordinator.position_interest.async_acquire_for(duration)
+
+    async def async_start_capture(self, filename: str | None = None) -> None:
+        """Record MQTT traffic received for this player to a JSONL file."""
+        if filename is None:
+            timestamp = dt_util.now().strftime("%Y%m%d-%H%M%S")
+            filename = f"{self._attr_unique_id}-{timestamp}.jsonl"
+        path = Path(self.hass.config.path(CAPTURE_DIRECTORY)) / Path(filename).name
+        await self.coordinator.root.async_start_capture(path)
+
+    async def async_stop_capture(self) -> None:
+        """Stop recording MQTT traffic for this player."""
+        await self.coordinator.root.async_stop_capture()
+
     async def _publish_command(self, topic_key: str, payload: str) -> None:
         """Publish a command to the device."""
         topic = self._mqtt_config.get(topic_key)
@@ -428,14 +743,132 @@ class MQTTMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
             _LOGGER.warning("Command topic %s not configured", topic_key)
             return
 
-        _LOGGER.debug("Publishing command to %s: %s", topic, payload)
+        if not is_connected(self.hass):
+            # Hold the command rather than letting the client burst stale
+            # commands on reconnect
+            _LOGGER.debug("Broker disconnected, queueing command for %s", topic)
+            self._outbox.put(topic_key, payload)
+            return
+
+        if self._queue_while_unavailable and self._available is False:
+            _LOGGER.debug("Device unavailable, queueing command for %s", topic)
+            self._outbox.put(topic_key, payload)
+            return
+
+        _LOGGER.debug("Publishing command to %s: %s", topic, Truncated(payload))
         try:
             await async_publish(
                 self.hass,
                 topic,
                 payload,
-                qos=0,
+                qos=self._command_qos(topic_key),
                 retain=False,
             )
         except Exception:
             _LOGGER.exception("Failed to publish command to %s", topic)
+
+    def _command_qos(self, topic_key: str) -> int:
+        """Return the configured QoS for a command topic."""
+        command = COMMAND_TOPICS.get(topic_key, (None, None))[1]
+        qos = self._mqtt_config.get("command_qos", {}).get(command)
+        if qos is None:
+            qos = self._mqtt_config.get("qos", 0)
+        return qos
+
+
+class MQTTMediaPlayerThumbnailView(HomeAssistantView):
+    """Serve resized album art for MQTT media players."""
+
+    requires_auth = False
+    url = "/api/mqtt_media_player/thumbnail/{entity_id}/{size}"
+    name = "api:mqtt_media_player:thumbnail"
+
+    async def get(
+        self, request: web.Request, entity_id: str, size: str
+    ) -> web.Response:
+        """Return the current media image of entity_id at the requested size."""
+        component = request.app[KEY_HASS].data.get(MEDIA_PLAYER_DOMAIN)
+        player = component.get_entity(entity_id) if component else None
+        if not isinstance(player, MQTTMediaPlayer):
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+
+        authenticated = (
+            request[KEY_AUTHENTICATED]
+            or request.query.get("token") == player.access_token
+        )
+        if not authenticated:
+            return web.Response(status=HTTPStatus.UNAUTHORIZED)
+
+        if not size.isdigit() or int(size) not in THUMBNAIL_SIZES:
+            return web.Response(status=HTTPStatus.BAD_REQUEST)
+
+        # The URL stays the same across tracks, so clients must revalidate;
+        # the ETag lets them skip the download while the art is unchanged
+        image_hash = player.media_image_hash
+        if image_hash is None:
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+        etag = f'"{image_hash}-{size}"'
+        headers = {"Cache-Control": "no-cache", "ETag": etag}
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
+
+        data, content_type = await player.async_get_media_thumbnail(int(size))
+        if data is None:
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+
+        return web.Response(body=data, content_type=content_type, headers=headers)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "mqtt_media_player/lists",
+        vol.Required("entity_id"): cv.entity_id,
+    }
+)
+@callback
+def websocket_get_lists(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Return the source list, sound mode list and group members of a player."""
+    component = hass.data.get(MEDIA_PLAYER_DOMAIN)
+    player = component.get_entity(msg["entity_id"]) if component else None
+    if not isinstance(player, MQTTMediaPlayer):
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Entity not found"
+        )
+        return
+
+    data = player.coordinator.data
+    connection.send_result(
+        msg["id"],
+        {
+            "source_list": data.get("source_list"),
+            "sound_mode_list": data.get("sound_mode_list"),
+            "group_members": data.get("group_members"),
+        },
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "mqtt_media_player/watch_position",
+        vol.Required("entity_id"): cv.entity_id,
+    }
+)
+@callback
+def websocket_watch_position(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Request frequent position updates until the subscription is closed."""
+    component = hass.data.get(MEDIA_PLAYER_DOMAIN)
+    player = component.get_entity(msg["entity_id"]) if component else None
+    if not isinstance(player, MQTTMediaPlayer):
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Entity not found"
+        )
+        return
+
+    connection.subscriptions[msg["id"]] = (
+        player.coordinator.position_interest.async_acquire()
+    )
+    connection.send_result(msg["id"])
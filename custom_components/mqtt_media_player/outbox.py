@@ -0,0 +1,80 @@
+"""Outbox holding commands that cannot be published yet."""
+
+import itertools
+import logging
+import time
+
+from .const import COLLAPSIBLE_COMMAND_TOPICS, TIMED_COMMAND_TOPICS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _is_future(payload: str, now: float) -> bool:
+    """Return False if payload is a Unix time that has passed."""
+    try:
+        return float(payload) > now
+    except ValueError:
+        return True
+
+
+class CommandOutbox:
+    """Bounded FIFO of pending commands.
+
+    Commands that set a value (COLLAPSIBLE_COMMAND_TOPICS) are collapsed to
+    the latest payload per topic; all others, like next or volume_up, are
+    kept in full. Commands older than the expiry, or for a time that has
+    passed (TIMED_COMMAND_TOPICS), are dropped when the outbox is drained,
+    and the oldest command is evicted when the outbox is full.
+    Draining returns commands in the order they were (last) queued.
+    """
+
+    def __init__(self, name: str, expiry: float, max_size: int) -> None:
+        """Initialize the outbox."""
+        self._name = name
+        self._expiry = expiry
+        self._max_size = max_size
+        # topic key, or (topic key, sequence) for commands that are not
+        # collapsed -> (topic key, payload, time queued)
+        self._pending: dict[object, tuple[str, str, float]] = {}
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        """Return the number of pending commands."""
+        return len(self._pending)
+
+    def put(self, topic_key: str, payload: str) -> None:
+        """Queue a command, replacing a pending one for the same set topic."""
+        if topic_key in COLLAPSIBLE_COMMAND_TOPICS:
+            key = topic_key
+            self._pending.pop(key, None)
+        else:
+            key = (topic_key, next(self._sequence))
+        self._pending[key] = (topic_key, payload, time.monotonic())
+
+        if len(self._pending) > self._max_size:
+            evicted = next(iter(self._pending))
+            _LOGGER.warning(
+                "%s: outbox full, dropped pending %s command",
+                self._name,
+                self._pending.pop(evicted)[0],
+            )
+
+    def drain(self) -> list[tuple[str, str]]:
+        """Remove and return all unexpired commands as (topic key, payload)."""
+        cutoff = time.monotonic() - self._expiry
+        now = time.time()
+        pending, self._pending = self._pending, {}
+
+        commands = [
+            (topic_key, payload)
+            for topic_key, payload, queued in pending.values()
+            if queued >= cutoff
+            and (topic_key not in TIMED_COMMAND_TOPICS or _is_future(payload, now))
+        ]
+        if len(commands) < len(pending):
+            _LOGGER.debug(
+                "%s: dropped %d expired commands",
+                self._name,
+                len(pending) - len(commands),
+            )
+        return commands
@@ -0,0 +1,123 @@
+"""Position reporting interval negotiated from interest in a player."""
+
+import asyncio
+import logging
+from collections.abc import Callable
+
+from homeassistant.components.mqtt import async_publish
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DEFAULT_POSITION_INTERVAL, DEFAULT_POSITION_INTERVAL_IDLE
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PositionInterest:
+    """Leases on fast position updates for the players on one topic.
+
+    Zones inheriting the device's position_interval_topic share one tracker,
+    so a lease on any of them asks the device for fast updates. Frontends
+    hold a lease while they show a player and automations take one for a
+    fixed duration. While any lease is held, position_interval is
+    published (retained) to the device's position_interval_topic; otherwise
+    position_interval_idle is, where 0 asks the device to stop reporting.
+    """
+
+    def __init__(self, hass: HomeAssistant, mqtt_config: dict) -> None:
+        """Initialize the interest tracker."""
+        self.hass = hass
+        self._name = mqtt_config.get("name")
+        self._topic = mqtt_config.get("position_interval_topic")
+        self._qos = mqtt_config.get("qos", 0)
+        self._fast = mqtt_config.get("position_interval", DEFAULT_POSITION_INTERVAL)
+        self._idle = mqtt_config.get(
+            "position_interval_idle", DEFAULT_POSITION_INTERVAL_IDLE
+        )
+        self._leases = 0
+        self._timers: set[Callable[[], None]] = set()
+        self._published: int | None = None
+        self._publish_task: asyncio.Task | None = None
+
+    @property
+    def interval(self) -> int:
+        """Return the position interval the device should use."""
+        return self._fast if self._leases else self._idle
+
+    @callback
+    def async_start(self) -> None:
+        """Publish the initial interval."""
+        if self._topic:
+            self._async_schedule_publish()
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel timed leases and pending publishes."""
+        for cancel in self._timers:
+            cancel()
+        self._timers.clear()
+        if self._publish_task is not None:
+            self._publish_task.cancel()
+
+    @callback
+    def async_acquire(self) -> Callable[[], None]:
+        """Take a lease, returning a function that releases it."""
+        self._leases += 1
+        self._async_schedule_publish()
+        released = False
+
+        @callback
+        def release() -> None:
+            nonlocal released
+            if released:
+                return
+            released = True
+            self._leases -= 1
+            self._async_schedule_publish()
+
+        return release
+
+    @callback
+    def async_acquire_for(self, seconds: float) -> None:
+        """Take a lease that is released after seconds."""
+        release = self.async_acquire()
+
+        @callback
+        def expire(_now) -> None:
+            self._timers.discard(cancel)
+            release()
+
+        cancel = async_call_later(self.hass, seconds, expire)
+        self._timers.add(cancel)
+
+    @callback
+    def _async_schedule_publish(self) -> None:
+        """Publish the interval if it changed, one publish at a time."""
+        if not self._topic or self._publish_task is not None:
+            return
+        if self.interval == self._published:
+            return
+        self._publish_task = self.hass.async_create_task(self._async_publish())
+
+    async def _async_publish(self) -> None:
+        """Publish until the device has the current interval."""
+        try:
+            while (interval := self.interval) != self._published:
+                _LOGGER.debug(
+                    "%s: requesting position every %d seconds", self._name, interval
+                )
+                self._published = interval
+                try:
+                    await async_publish(
+                        self.hass,
+                        self._topic,
+                        str(interval),
+                        qos=self._qos,
+                        retain=True,
+                    )
+                except Exception:
+                    _LOGGER.exception("Failed to publish position interval")
+                    self._published = None
+                    return
+        finally:
+            self._publish_task = None
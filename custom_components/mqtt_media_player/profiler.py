@@ -0,0 +1,155 @@
+"""On-demand profiler for the integration's hot paths."""
+
+import functools
+import inspect
+import logging
+import time
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+
+from .const import DATA_PROFILER, DOMAIN, PROFILE_DIRECTORY
+from .coordinator import MQTTMediaPlayerCoordinator
+from .media_player import MQTTMediaPlayer
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _instrumented_methods() -> list[tuple[type, str]]:
+    """Return the (class, method name) pairs instrumented while profiling."""
+    methods = [
+        (MQTTMediaPlayerCoordinator, name)
+        for name in vars(MQTTMediaPlayerCoordinator)
+        if name.startswith("_handle_")
+    ]
+    methods.append((MQTTMediaPlayerCoordinator, "async_set_updated_data"))
+    methods.append((MQTTMediaPlayer, "async_write_ha_state"))
+    methods.append((MQTTMediaPlayer, "_publish_command"))
+    return methods
+
+
+class HotPathProfiler:
+    """Temporarily wrap hot-path methods to collect call counts and timings.
+
+    Methods are patched on their classes only while a profile is running, so
+    nothing is measured (or slowed down) the rest of the time.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the profiler."""
+        # qualified name -> [call count, total seconds, max seconds]
+        self.stats: dict[str, list] = {}
+        self._originals: list[tuple[type, str, object | None]] = []
+
+    def start(self) -> None:
+        """Patch the instrumented methods."""
+        for cls, name in _instrumented_methods():
+            original = cls.__dict__.get(name)
+            self._originals.append((cls, name, original))
+            setattr(cls, name, self._wrap(f"{cls.__name__}.{name}", getattr(cls, name)))
+
+    def stop(self) -> None:
+        """Restore the original methods."""
+        for cls, name, original in reversed(self._originals):
+            if original is None:
+                # Method was inherited, drop the override
+                delattr(cls, name)
+            else:
+                setattr(cls, name, original)
+        self._originals.clear()
+
+    def _record(self, key: str, elapsed: float) -> None:
+        """Add one call to the stats for key."""
+        entry = self.stats.setdefault(key, [0, 0.0, 0.0])
+        entry[0] += 1
+        entry[1] += elapsed
+        entry[2] = max(entry[2], elapsed)
+
+    def _wrap(self, key: str, func):
+        """Return a timing wrapper for func."""
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    self._record(key, time.perf_counter() - start)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._record(key, time.perf_counter() - start)
+
+        return wrapper
+
+    def report(self, duration: float) -> str:
+        """Format the collected stats as a text table."""
+        lines = [
+            f"MQTT Media Player profile, {duration:.0f} seconds, "
+            f"finished {dt_util.now().isoformat()}",
+            "Times are inclusive of nested instrumented calls.",
+            "",
+            f"{'function':<58} {'calls':>8} {'total ms':>10} "
+            f"{'mean us':>9} {'max us':>9}",
+        ]
+        for key, (calls, total, longest) in sorted(
+            self.stats.items(), key=lambda item: item[1][1], reverse=True
+        ):
+            lines.append(
+                f"{key:<58} {calls:>8} {total * 1e3:>10.2f} "
+                f"{total / calls * 1e6:>9.1f} {longest * 1e6:>9.1f}"
+            )
+        if not self.stats:
+            lines.append("(no calls recorded)")
+        return "\n".join(lines) + "\n"
+
+
+def _write_report(path: Path, report: str) -> None:
+    """Write a profile report (runs in executor)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(report, encoding="utf-8")
+
+
+async def async_handle_profile(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Start profiling the integration's hot paths for the requested duration.
+
+    Returns immediately; the report is written once the duration has passed.
+    """
+    if hass.data.get(DATA_PROFILER) is not None:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN, translation_key="profile_running"
+        )
+
+    duration = call.data["duration"]
+    profiler = HotPathProfiler()
+    hass.data[DATA_PROFILER] = profiler
+    profiler.start()
+    _LOGGER.info("Profiling MQTT Media Player for %d seconds", duration)
+
+    @callback
+    def _async_finish(_now) -> None:
+        profiler.stop()
+        hass.data.pop(DATA_PROFILER, None)
+        hass.async_create_task(_async_write_report(hass, profiler, duration))
+
+    async_call_later(hass, duration, _async_finish)
+
+
+async def _async_write_report(
+    hass: HomeAssistant, profiler: HotPathProfiler, duration: float
+) -> None:
+    """Write the report of a finished profile."""
+    timestamp = dt_util.now().strftime("%Y%m%d-%H%M%S")
+    path = Path(hass.config.path(PROFILE_DIRECTORY)) / f"profile-{timestamp}.txt"
+    await hass.async_add_executor_job(_write_report, path, profiler.report(duration))
+    _LOGGER.info("Wrote MQTT Media Player profile to %s", path)
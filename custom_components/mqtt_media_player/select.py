@@ -0,0 +1,139 @@
+"""Source and sound mode selects for players that keep lists out of their state."""
+
+import logging
+
+from homeassistant.components.media_player.const import (
+    ATTR_INPUT_SOURCE,
+    ATTR_SOUND_MODE,
+    DOMAIN as MEDIA_PLAYER_DOMAIN,
+    SERVICE_SELECT_SOUND_MODE,
+    SERVICE_SELECT_SOURCE,
+)
+from homeassistant.components.select import SelectEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+from .coordinator import MQTTMediaPlayerCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# (feature flag, data key of the option, data key of the list, name,
+#  media player service, service attribute)
+SELECTS = (
+    (
+        "supports_select_source",
+        "source",
+        "source_list",
+        "Source",
+        SERVICE_SELECT_SOURCE,
+        ATTR_INPUT_SOURCE,
+    ),
+    (
+        "supports_select_sound_mode",
+        "sound_mode",
+        "sound_mode_list",
+        "Sound mode",
+        SERVICE_SELECT_SOUND_MODE,
+        ATTR_SOUND_MODE,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up selects for players configured with lists_in_state off."""
+    coordinator: MQTTMediaPlayerCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    async_add_entities(
+        MQTTMediaPlayerSelect(player_coordinator, config_entry, *select)
+        for player_coordinator in coordinator.players
+        if not player_coordinator.mqtt_config["lists_in_state"]
+        for feature, *select in SELECTS
+        if player_coordinator.supported_features.get(feature)
+    )
+
+
+class MQTTMediaPlayerSelect(CoordinatorEntity, SelectEntity):
+    """Select mirroring a player's source or sound mode and its options.
+
+    State is only written when the option or the list changes, so the list is
+    not copied on every update of the player.
+    """
+
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: MQTTMediaPlayerCoordinator,
+        config_entry: ConfigEntry,
+        option_key: str,
+        options_key: str,
+        name: str,
+        service: str,
+        service_attribute: str,
+    ) -> None:
+        """Initialize the select."""
+        super().__init__(coordinator)
+        self._option_key = option_key
+        self._options_key = options_key
+        self._service = service
+        self._service_attribute = service_attribute
+
+        player_unique_id = coordinator.mqtt_config.get("unique_id", config_entry.title)
+        self._player_unique_id = player_unique_id
+        self._attr_unique_id = f"{player_unique_id}_{option_key}"
+        # Zones share a device, so their selects carry the zone name
+        self._attr_name = (
+            f"{coordinator.mqtt_config['name']} {name.lower()}"
+            if coordinator.zone
+            else name
+        )
+        self._attr_device_info = DeviceInfo(identifiers=coordinator.device_identifiers)
+        self._written: tuple | None = None
+
+    @property
+    def available(self) -> bool:
+        """Return False while the player is unavailable."""
+        return self.coordinator.data.get("available") is not False
+
+    @property
+    def current_option(self) -> str | None:
+        """Return the selected option."""
+        return self.coordinator.data.get(self._option_key)
+
+    @property
+    def options(self) -> list[str]:
+        """Return the available options."""
+        return self.coordinator.data.get(self._options_key) or []
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the option, options or availability changed."""
+        written = (
+            self.available,
+            self.coordinator.data.get(self._option_key),
+            self.coordinator.data.get(self._options_key),
+        )
+        if written != self._written:
+            self._written = written
+            self.async_write_ha_state()
+
+    async def async_select_option(self, option: str) -> None:
+        """Select an option through the player, which handles delivery."""
+        entity_id = er.async_get(self.hass).async_get_entity_id(
+            MEDIA_PLAYER_DOMAIN, DOMAIN, self._player_unique_id
+        )
+        await self.hass.services.async_call(
+            MEDIA_PLAYER_DOMAIN,
+            self._service,
+            {ATTR_ENTITY_ID: entity_id, self._service_attribute: option},
+            blocking=True,
+        )
@@ -0,0 +1,201 @@
+"""Sensors for the MQTT Media Player integration."""
+
+import logging
+from collections.abc import Callable
+from datetime import timedelta
+
+from homeassistant.components.media_player import DOMAIN as MEDIA_PLAYER_DOMAIN
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+
+from .const import DOMAIN, LATENCY_PERCENTILES
+from .coordinator import MQTTMediaPlayerCoordinator
+from .fleet import FleetSummary, async_get_fleet
+from .latency import IngestLatency, async_get_ingest_latency
+
+_LOGGER = logging.getLogger(__name__)
+
+# Percentiles are read from the histograms, not pushed on every message
+SCAN_INTERVAL = timedelta(seconds=60)
+
+# (unique ID suffix, name, value)
+FLEET_SENSORS: tuple[tuple[str, str, Callable[[FleetSummary], int]], ...] = (
+    ("players_playing", "MQTT Media Players playing", lambda f: f.states["playing"]),
+    ("players_idle", "MQTT Media Players idle", lambda f: f.states["idle"]),
+    ("active_groups", "MQTT Media Player active groups", lambda f: f.active_groups),
+)
+
+
+async def async_setup_platform(
+    hass: HomeAssistant,
+    config: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None,
+) -> None:
+    """Set up the integration-wide sensors, loaded once from async_setup."""
+    ingest_latency = async_get_ingest_latency(hass)
+    async_add_entities(
+        IngestLatencySensor(
+            ingest_latency,
+            percentile,
+            unique_id=f"{DOMAIN}_ingest_latency_p{percentile}",
+            name=f"MQTT Media Player ingest latency p{percentile}",
+        )
+        for percentile in LATENCY_PERCENTILES
+    )
+
+    fleet = async_get_fleet(hass)
+    async_add_entities(
+        FleetSensor(fleet, unique_id=f"{DOMAIN}_{key}", name=name, value_fn=value_fn)
+        for key, name, value_fn in FLEET_SENSORS
+    )
+    async_add_entities([UnavailablePlayersSensor(fleet)])
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the diagnostic sensors of a device."""
+    coordinator: MQTTMediaPlayerCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    unique_id = coordinator.mqtt_config.get("unique_id", config_entry.title)
+    async_add_entities(
+        IngestLatencySensor(
+            coordinator.ingest_latency,
+            percentile,
+            unique_id=f"{unique_id}_ingest_latency_p{percentile}",
+            name=f"Ingest latency p{percentile}",
+            device_info=DeviceInfo(identifiers=coordinator.device_identifiers),
+        )
+        for percentile in LATENCY_PERCENTILES
+    )
+
+
+class IngestLatencySensor(SensorEntity):
+    """A percentile of the time from MQTT receipt to state write.
+
+    The state covers all topics; the ``topics`` attribute breaks it down per
+    topic and is left out of the recorder.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_suggested_display_precision = 1
+    _unrecorded_attributes = frozenset({"topics"})
+
+    def __init__(
+        self,
+        ingest_latency: IngestLatency,
+        percentile: int,
+        *,
+        unique_id: str,
+        name: str,
+        device_info: DeviceInfo | None = None,
+    ) -> None:
+        """Initialize the sensor."""
+        self._ingest_latency = ingest_latency
+        self._percentile = percentile
+        self._attr_unique_id = unique_id
+        self._attr_name = name
+        if device_info is not None:
+            self._attr_has_entity_name = True
+            self._attr_device_info = device_info
+
+    async def async_update(self) -> None:
+        """Read the percentile from the histograms."""
+        self._attr_native_value = self._ingest_latency.total.percentile(
+            self._percentile
+        )
+        self._attr_extra_state_attributes = {
+            "topics": {
+                topic_key: histogram.percentile(self._percentile)
+                for topic_key, histogram in sorted(self._ingest_latency.topics.items())
+            }
+        }
+
+
+class FleetSensor(SensorEntity):
+    """A count from the fleet summary, written only when it changes."""
+
+    _attr_should_poll = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self,
+        fleet: FleetSummary,
+        *,
+        unique_id: str,
+        name: str,
+        value_fn: Callable[[FleetSummary], int],
+    ) -> None:
+        """Initialize the sensor."""
+        self._fleet = fleet
+        self._value_fn = value_fn
+        self._attr_unique_id = unique_id
+        self._attr_name = name
+        self._attr_native_value = value_fn(fleet)
+
+    async def async_added_to_hass(self) -> None:
+        """Follow fleet summary changes."""
+        self.async_on_remove(self._fleet.async_add_listener(self._async_fleet_changed))
+
+    @callback
+    def _async_fleet_changed(self) -> None:
+        """Write state if this sensor's count changed."""
+        value = self._value_fn(self._fleet)
+        if value != self._attr_native_value:
+            self._attr_native_value = value
+            self.async_write_ha_state()
+
+
+class UnavailablePlayersSensor(FleetSensor):
+    """Number of unavailable players, with their entity IDs."""
+
+    def __init__(self, fleet: FleetSummary) -> None:
+        """Initialize the sensor."""
+        super().__init__(
+            fleet,
+            unique_id=f"{DOMAIN}_players_unavailable",
+            name="MQTT Media Players unavailable",
+            value_fn=lambda f: len(f.unavailable),
+        )
+        self._players = set(fleet.unavailable)
+
+    @callback
+    def _async_fleet_changed(self) -> None:
+        """Write state if the set of unavailable players changed."""
+        if self._fleet.unavailable != self._players:
+            self._players = set(self._fleet.unavailable)
+            self._attr_native_value = len(self._players)
+            self.async_write_ha_state()
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return the entity IDs of the unavailable players."""
+        registry = er.async_get(self.hass)
+        return {
+            "entity_ids": sorted(
+                entity_id
+                for player in self._fleet.unavailable
+                if (
+                    entity_id := registry.async_get_entity_id(
+                        MEDIA_PLAYER_DOMAIN,
+                        DOMAIN,
+                        player.mqtt_config.get("unique_id", player.config_entry.title),
+                    )
+                )
+            )
+        }
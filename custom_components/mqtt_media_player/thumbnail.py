@@ -0,0 +1,168 @@
+"""Album art thumbnail cache for MQTT Media Player."""
+
+import asyncio
+import io
+import logging
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+
+from homeassistant.core import HomeAssistant
+
+from .const import MAX_CACHED_IMAGES, MAX_CONCURRENT_THUMBNAILS
+
+_LOGGER = logging.getLogger(__name__)
+
+# Pillow format name -> content type for formats we re-encode as-is
+THUMBNAIL_FORMATS = {
+    "JPEG": "image/jpeg",
+    "PNG": "image/png",
+    "WEBP": "image/webp",
+}
+
+
+def _resize_image(image_data: bytes, size: int) -> tuple[bytes, str] | None:
+    """Resize an image to fit in a size x size box (runs in executor)."""
+    try:
+        from PIL import Image  # noqa: PLC0415
+    except ImportError:
+        _LOGGER.debug("Pillow not available, serving original image")
+        return None
+
+    with Image.open(io.BytesIO(image_data)) as image:
+        if max(image.size) <= size:
+            return None
+
+        image_format = image.format if image.format in THUMBNAIL_FORMATS else "PNG"
+        image.thumbnail((size, size))
+        if image_format == "JPEG" and image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+
+        output = io.BytesIO()
+        image.save(output, format=image_format)
+        return output.getvalue(), THUMBNAIL_FORMATS[image_format]
+
+
+# Leading bytes -> content type, for image payloads without a declared type
+IMAGE_SIGNATURES = {
+    b"\xff\xd8\xff": "image/jpeg",
+    b"\x89PNG\r\n\x1a\n": "image/png",
+    b"GIF87a": "image/gif",
+    b"GIF89a": "image/gif",
+}
+
+
+def guess_image_content_type(data: bytes) -> str | None:
+    """Return the content type of image bytes from their magic bytes."""
+    for signature, content_type in IMAGE_SIGNATURES.items():
+        if data.startswith(signature):
+            return content_type
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+class _CachedImage:
+    """Original image bytes plus any resized variants."""
+
+    def __init__(self, data: bytes, content_type: str | None) -> None:
+        """Initialize the cached image."""
+        self.data = data
+        self.content_type = content_type
+        self.variants: dict[int, tuple[bytes, str | None]] = {}
+
+
+class ThumbnailCache:
+    """Cache original album art and its resized variants for one device."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self._images: OrderedDict[str, _CachedImage] = OrderedDict()
+        # image key -> fetch in flight, shared by concurrent requests
+        self._pending: dict[str, asyncio.Task[_CachedImage | None]] = {}
+        self._resize_semaphore = asyncio.Semaphore(MAX_CONCURRENT_THUMBNAILS)
+
+    async def async_get(
+        self,
+        image_key: str,
+        fetch: Callable[[], Awaitable[tuple[bytes | None, str | None]]],
+        size: int | None = None,
+    ) -> tuple[bytes | None, str | None]:
+        """Return the image for image_key, resized to size if given."""
+        cached = await self._async_get_original(image_key, fetch)
+        if cached is None:
+            return None, None
+
+        if size is None:
+            return cached.data, cached.content_type
+
+        if size not in cached.variants:
+            async with self._resize_semaphore:
+                # Another request may have generated it while we waited
+                if size not in cached.variants:
+                    cached.variants[size] = await self._async_resize(cached, size)
+
+        return cached.variants[size]
+
+    async def _async_get_original(
+        self,
+        image_key: str,
+        fetch: Callable[[], Awaitable[tuple[bytes | None, str | None]]],
+    ) -> _CachedImage | None:
+        """Return the cached original image, fetching it once if needed."""
+        if image_key in self._images:
+            self._images.move_to_end(image_key)
+            return self._images[image_key]
+
+        # The fetch runs as its own task, so a request that is cancelled (the
+        # client went away) doesn't cancel it for the others waiting on it
+        if (task := self._pending.get(image_key)) is None:
+            task = self.hass.async_create_task(self._async_fetch(image_key, fetch))
+            self._pending[image_key] = task
+        return await asyncio.shield(task)
+
+    async def _async_fetch(
+        self,
+        image_key: str,
+        fetch: Callable[[], Awaitable[tuple[bytes | None, str | None]]],
+    ) -> _CachedImage | None:
+        """Fetch an original image and cache it."""
+        try:
+            data, content_type = await fetch()
+        finally:
+            del self._pending[image_key]
+        if data is None:
+            return None
+
+        cached = _CachedImage(data, content_type)
+        self._images[image_key] = cached
+        while len(self._images) > MAX_CACHED_IMAGES:
+            self._images.popitem(last=False)
+        return cached
+
+    async def _async_resize(
+        self, cached: _CachedImage, size: int
+    ) -> tuple[bytes, str | None]:
+        """Generate a resized variant in the executor."""
+        try:
+            resized = await self.hass.async_add_executor_job(
+                _resize_image, cached.data, size
+            )
+        except Exception:
+            _LOGGER.exception("Failed to resize image to %dpx", size)
+            resized = None
+
+        if resized is None:
+            return cached.data, cached.content_type
+
+        _LOGGER.debug(
+            "Generated %dpx thumbnail (%d -> %d bytes)",
+            size,
+            len(cached.data),
+            len(resized[0]),
+        )
+        return resized
+
+    def clear(self) -> None:
+        """Drop all cached images."""
+        self._images.clear()
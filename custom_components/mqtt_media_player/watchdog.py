@@ -0,0 +1,106 @@
+"""Staleness watchdog for MQTT Media Player devices."""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import DATA_WATCHDOG, WATCHDOG_SLOTS, WATCHDOG_TICK_SECONDS
+
+if TYPE_CHECKING:
+    from .coordinator import MQTTMediaPlayerCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_get_watchdog(hass: HomeAssistant) -> StalenessWatchdog:
+    """Return the integration-wide staleness watchdog."""
+    if DATA_WATCHDOG not in hass.data:
+        hass.data[DATA_WATCHDOG] = StalenessWatchdog(hass)
+    return hass.data[DATA_WATCHDOG]
+
+
+class StalenessWatchdog:
+    """Single timer wheel tracking message deadlines for all coordinators.
+
+    Each registered coordinator sits in exactly one slot of the wheel. Receiving
+    a message only records a timestamp on the coordinator; the deadline is
+    checked when the wheel reaches its slot, and the coordinator is either
+    marked stale or moved to the slot of its new deadline.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the watchdog."""
+        self.hass = hass
+        self._slots: list[set[MQTTMediaPlayerCoordinator]] = [
+            set() for _ in range(WATCHDOG_SLOTS)
+        ]
+        self._slot_of: dict[MQTTMediaPlayerCoordinator, int] = {}
+        self._index = 0
+        self._unsub_tick = None
+
+    @callback
+    def async_schedule(self, coordinator: MQTTMediaPlayerCoordinator) -> None:
+        """Place a coordinator on the wheel at its current deadline."""
+        self._async_remove_from_slot(coordinator)
+
+        delay = coordinator.last_message + coordinator.staleness_timeout
+        delay -= time.monotonic()
+        ticks = math.ceil(delay / WATCHDOG_TICK_SECONDS)
+        # Deadlines beyond one revolution are re-checked at the far end
+        ticks = min(max(ticks, 1), WATCHDOG_SLOTS - 1)
+
+        slot = (self._index + ticks) % WATCHDOG_SLOTS
+        self._slots[slot].add(coordinator)
+        self._slot_of[coordinator] = slot
+
+        if self._unsub_tick is None:
+            self._unsub_tick = async_track_time_interval(
+                self.hass,
+                self._async_tick,
+                timedelta(seconds=WATCHDOG_TICK_SECONDS),
+                name="mqtt_media_player staleness watchdog",
+            )
+
+    @callback
+    def async_unschedule(self, coordinator: MQTTMediaPlayerCoordinator) -> None:
+        """Remove a coordinator from the wheel."""
+        self._async_remove_from_slot(coordinator)
+        if not self._slot_of and self._unsub_tick is not None:
+            self._unsub_tick()
+            self._unsub_tick = None
+
+    @callback
+    def _async_remove_from_slot(self, coordinator: MQTTMediaPlayerCoordinator) -> None:
+        """Drop a coordinator from whichever slot it is in."""
+        slot = self._slot_of.pop(coordinator, None)
+        if slot is not None:
+            self._slots[slot].discard(coordinator)
+
+    @callback
+    def _async_tick(self, _now) -> None:
+        """Advance the wheel one slot and check the deadlines in it."""
+        self._index = (self._index + 1) % WATCHDOG_SLOTS
+        due = self._slots[self._index]
+        if not due:
+            return
+
+        self._slots[self._index] = set()
+        now = time.monotonic()
+        for coordinator in due:
+            del self._slot_of[coordinator]
+            if coordinator.last_message + coordinator.staleness_timeout <= now:
+                coordinator.async_set_stale()
+            else:
+                self.async_schedule(coordinator)
+
+        if not self._slot_of and self._unsub_tick is not None:
+            self._unsub_tick()
+            self._unsub_tick = None
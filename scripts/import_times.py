@@ -0,0 +1,104 @@
+"""Report the import cost of each module of the integration.
+
+Each module is imported in a fresh interpreter with ``-X importtime`` after
+Home Assistant's core and MQTT component are already loaded, so the numbers
+show what the integration itself adds to startup. Importing a submodule also
+imports the package ``__init__``, so every row includes it.
+
+Usage:
+    python scripts/import_times.py [--budget MS] [--runs N]
+
+With --budget, exits non-zero if any module exceeds the budget.
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = "custom_components.mqtt_media_player"
+
+# Loaded by Home Assistant before our integration, so not counted against it
+PRELOAD = (
+    "import homeassistant.core, homeassistant.helpers.update_coordinator, "
+    "homeassistant.components.mqtt, homeassistant.components.media_player"
+)
+
+IMPORT_TIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def integration_modules() -> list[str]:
+    """Return the dotted names of the integration's modules."""
+    package_dir = ROOT.joinpath(*PACKAGE.split("."))
+    return sorted(
+        PACKAGE if path.stem == "__init__" else f"{PACKAGE}.{path.stem}"
+        for path in package_dir.glob("*.py")
+    )
+
+
+def measure(module: str) -> tuple[float, list[tuple[str, float]]]:
+    """Import module once and return (cumulative ms, heaviest new imports)."""
+    result = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"{PRELOAD}\nimport sys; sys.stderr.write('--- start\\n')\nimport {module}",
+        ],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    _, _, measured = result.stderr.partition("--- start\n")
+
+    total_us = 0
+    imports = []
+    for line in measured.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        imports.append((name, int(self_us) / 1000))
+        if len(indent) == 1:
+            # Top-level entry, its cumulative time includes everything below
+            total_us += int(cumulative_us)
+
+    imports.sort(key=lambda item: item[1], reverse=True)
+    return total_us / 1000, imports
+
+
+def main() -> int:
+    """Measure every module and print a report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget", type=float, help="per-module budget in ms")
+    parser.add_argument(
+        "--runs", type=int, default=3, help="runs per module, best is reported"
+    )
+    parser.add_argument(
+        "--top", type=int, default=3, help="heaviest imports listed per module"
+    )
+    args = parser.parse_args()
+
+    over_budget = []
+    print(f"{'module':<50} {'ms':>8}  heaviest imports (self ms)")
+    for module in integration_modules():
+        total, imports = min(
+            (measure(module) for _ in range(args.runs)), key=lambda run: run[0]
+        )
+        heaviest = ", ".join(f"{name} {ms:.1f}" for name, ms in imports[: args.top])
+        print(f"{module:<50} {total:>8.1f}  {heaviest}")
+        if args.budget is not None and total > args.budget:
+            over_budget.append(module)
+
+    if over_budget:
+        print(f"\nOver the {args.budget:.1f} ms budget: {', '.join(over_budget)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
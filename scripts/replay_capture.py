@@ -0,0 +1,192 @@
+"""Replay an MQTT traffic capture through MQTTMediaPlayerCoordinator.
+
+Captures are recorded with the mqtt_media_player.start_capture service. The
+coordinator runs against an in-process stub of Home Assistant's MQTT API, so no
+broker is needed, and the replay reports dispatch throughput and timing.
+
+Usage:
+    python scripts/replay_capture.py CAPTURE.jsonl [--speed 0] [--repeat 1]
+
+A speed of 0 replays as fast as possible; 1 replays in real time. Flood
+protection is disabled, so every message is dispatched as it is replayed.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import MappingProxyType
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from homeassistant.components.mqtt.models import ReceiveMessage  # noqa: E402
+from homeassistant.config_entries import SOURCE_USER, ConfigEntry  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.helpers import device_registry as dr  # noqa: E402
+from homeassistant.helpers import entity_registry as er  # noqa: E402
+from homeassistant.helpers import issue_registry as ir  # noqa: E402
+
+from custom_components.mqtt_media_player import coordinator as coordinator_module  # noqa: E402
+from custom_components.mqtt_media_player import (  # noqa: E402
+    position_interest as position_interest_module,
+)
+from custom_components.mqtt_media_player.capture import decode_message  # noqa: E402
+from custom_components.mqtt_media_player.config_flow import (  # noqa: E402
+    MqttMediaPlayerConfigFlow,
+)
+from custom_components.mqtt_media_player.const import DOMAIN  # noqa: E402
+
+
+def topic_matches(subscription: str, topic: str) -> bool:
+    """Return True if topic matches an MQTT subscription with wildcards."""
+    sub_parts = subscription.split("/")
+    topic_parts = topic.split("/")
+    for index, sub_part in enumerate(sub_parts):
+        if sub_part == "#":
+            return True
+        if index >= len(topic_parts):
+            return False
+        if sub_part not in ("+", topic_parts[index]):
+            return False
+    return len(sub_parts) == len(topic_parts)
+
+
+class StubMQTT:
+    """In-process stand-in for homeassistant.components.mqtt."""
+
+    def __init__(self) -> None:
+        """Initialize the stub."""
+        self.subscriptions: list[tuple[str, object]] = []
+        self.published = 0
+
+    async def async_subscribe(self, _hass, topic, msg_callback, qos=0, **_kwargs):
+        """Register a callback and return its unsubscribe function."""
+        entry = (topic, msg_callback)
+        self.subscriptions.append(entry)
+        return lambda: self.subscriptions.remove(entry)
+
+    async def async_publish(self, _hass, _topic, _payload, *_args, **_kwargs):
+        """Count a publish; there is no device to receive it."""
+        self.published += 1
+
+    def deliver(self, topic: str, payload: str | bytes) -> int:
+        """Deliver a message to matching subscribers, returning the match count."""
+        delivered = 0
+        for subscription, msg_callback in list(self.subscriptions):
+            if topic_matches(subscription, topic):
+                msg_callback(
+                    ReceiveMessage(
+                        topic=topic,
+                        payload=payload,
+                        qos=0,
+                        retain=False,
+                        subscribed_topic=subscription,
+                        timestamp=time.monotonic(),
+                    )
+                )
+                delivered += 1
+        return delivered
+
+
+def load_capture(path: Path) -> tuple[dict, list[tuple[float, str, str | bytes]]]:
+    """Read a capture file into its config and message list."""
+    with path.open(encoding="utf-8") as capture_file:
+        header = json.loads(capture_file.readline())
+        messages = [decode_message(json.loads(line)) for line in capture_file if line]
+    return header["config"], messages
+
+
+async def replay(path: Path, speed: float, repeat: int) -> None:
+    """Replay a capture and print a timing report."""
+    mqtt_config, messages = load_capture(path)
+    # Measure every message, not the sampled dispatch of a quarantined device
+    mqtt_config = {**mqtt_config, "max_message_rate": 0}
+    stub = StubMQTT()
+    coordinator_module.async_subscribe = stub.async_subscribe
+    coordinator_module.async_publish = stub.async_publish
+    position_interest_module.async_publish = stub.async_publish
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        # Handlers look up entities and raise repair issues
+        await dr.async_load(hass)
+        await er.async_load(hass)
+        await ir.async_load(hass)
+        config_entry = ConfigEntry(
+            data={"mqtt_config": mqtt_config},
+            discovery_keys=MappingProxyType({}),
+            domain=DOMAIN,
+            minor_version=MqttMediaPlayerConfigFlow.MINOR_VERSION,
+            options={},
+            source=SOURCE_USER,
+            subentries_data=None,
+            title=mqtt_config.get("name", path.stem),
+            unique_id=mqtt_config.get("unique_id"),
+            version=MqttMediaPlayerConfigFlow.VERSION,
+        )
+        coordinator = coordinator_module.MQTTMediaPlayerCoordinator(hass, config_entry)
+        await coordinator.async_added_to_hass()
+
+        updates = 0
+
+        def count_update() -> None:
+            nonlocal updates
+            updates += 1
+
+        coordinator.async_add_listener(count_update)
+
+        delivered = unmatched = 0
+        dispatch_time = 0.0
+        started = time.perf_counter()
+        for _ in range(repeat):
+            first_timestamp = messages[0][0] if messages else 0.0
+            replay_start = time.monotonic()
+            for timestamp, topic, payload in messages:
+                if speed > 0:
+                    due = replay_start + (timestamp - first_timestamp) / speed
+                    await asyncio.sleep(max(0.0, due - time.monotonic()))
+                dispatch_start = time.perf_counter()
+                matched = stub.deliver(topic, payload)
+                dispatch_time += time.perf_counter() - dispatch_start
+                delivered += matched
+                unmatched += not matched
+            # Let any work scheduled by the handlers run
+            await hass.async_block_till_done()
+        elapsed = time.perf_counter() - started
+
+        await coordinator.async_will_remove_from_hass()
+        await hass.async_stop(force=True)
+
+    total = len(messages) * repeat
+    print(f"Capture:          {path} ({len(messages)} messages x {repeat})")
+    print(f"Delivered:        {delivered} ({unmatched} with no subscriber)")
+    print(f"Coordinator updates: {updates}")
+    print(f"Publishes:        {stub.published}")
+    print(f"Wall time:        {elapsed:.3f} s ({total / elapsed:.0f} msg/s)")
+    if delivered:
+        print(f"Dispatch time:    {dispatch_time:.3f} s")
+        print(f"Per message:      {dispatch_time / delivered * 1e6:.1f} us")
+
+
+def main() -> None:
+    """Parse arguments and run the replay."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("capture", type=Path, help="capture file (JSONL)")
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=0,
+        help="replay speed multiplier; 0 replays as fast as possible",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=1, help="number of times to replay"
+    )
+    args = parser.parse_args()
+    asyncio.run(replay(args.capture, args.speed, args.repeat))
+
+
+if __name__ == "__main__":
+    main()